@@ -1,8 +1,13 @@
+import asyncio
 import pytest
 import os
 import json
-from unittest.mock import patch, AsyncMock
-from workato_mcp.client import WorkatoClient
+import inspect
+import httpx
+import orjson
+from unittest.mock import patch, AsyncMock, MagicMock
+from workato_mcp.client import RetryTransport, WorkatoClient, WorkatoSyncClient, aclose_shared_clients
+from workato_mcp.models import LookupTableRow
 
 # Sample test data
 SAMPLE_RECIPES = [
@@ -32,6 +37,12 @@ SAMPLE_CONNECTIONS = [
     {"id": 302, "name": "Connection 2"}
 ]
 
+def mock_response(data):
+    """Build a fake httpx response whose JSON body is ``data``."""
+    response = MagicMock()
+    response.content = orjson.dumps(data)
+    return response
+
 @pytest.fixture
 def client():
     """Create a WorkatoClient instance for testing."""
@@ -41,36 +52,23 @@ def client():
 @pytest.mark.asyncio
 async def test_get_recipes(client):
     """Test getting recipes."""
-    with patch("httpx.AsyncClient.get") as mock_get:
-        mock_response = AsyncMock()
-        mock_response.json.return_value = SAMPLE_RECIPES
-        mock_response.raise_for_status = AsyncMock()
-        mock_get.return_value = mock_response
+    with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = mock_response(SAMPLE_RECIPES)
         
         recipes = await client.get_recipes()
         
-        mock_get.assert_called_once_with(
-            "https://test.workato.com/api/recipes",
-            headers=client.headers,
-            params={}
-        )
+        mock_request.assert_called_once_with("GET", "/recipes", params={})
         assert recipes == SAMPLE_RECIPES
 
 @pytest.mark.asyncio
 async def test_get_recipe_details(client):
     """Test getting recipe details."""
-    with patch("httpx.AsyncClient.get") as mock_get:
-        mock_response = AsyncMock()
-        mock_response.json.return_value = SAMPLE_RECIPE_DETAILS
-        mock_response.raise_for_status = AsyncMock()
-        mock_get.return_value = mock_response
+    with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = mock_response(SAMPLE_RECIPE_DETAILS)
         
         recipe = await client.get_recipe_details(1)
         
-        mock_get.assert_called_once_with(
-            "https://test.workato.com/api/recipes/1",
-            headers=client.headers
-        )
+        mock_request.assert_called_once_with("GET", "/recipes/1")
         assert recipe == SAMPLE_RECIPE_DETAILS
 
 @pytest.mark.asyncio
@@ -82,18 +80,16 @@ async def test_create_recipe(client):
         "code": json.dumps({"trigger": {"type": "webhook"}, "actions": []})
     }
     
-    with patch("httpx.AsyncClient.post") as mock_post:
-        mock_response = AsyncMock()
-        mock_response.json.return_value = {**recipe_data, "id": 3}
-        mock_response.raise_for_status = AsyncMock()
-        mock_post.return_value = mock_response
+    with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = mock_response({**recipe_data, "id": 3})
         
         result = await client.create_recipe(recipe_data)
         
-        mock_post.assert_called_once_with(
-            "https://test.workato.com/api/recipes",
-            headers=client.headers,
-            json={"recipe": recipe_data}
+        mock_request.assert_called_once_with(
+            "POST",
+            "/recipes",
+            content=orjson.dumps({"recipe": recipe_data}),
+            headers={"Content-Type": "application/json"}
         )
         assert result["id"] == 3
         assert result["name"] == "New Recipe"
@@ -101,17 +97,474 @@ async def test_create_recipe(client):
 @pytest.mark.asyncio
 async def test_get_jobs(client):
     """Test getting jobs."""
-    with patch("httpx.AsyncClient.get") as mock_get:
-        mock_response = AsyncMock()
-        mock_response.json.return_value = SAMPLE_JOBS
-        mock_response.raise_for_status = AsyncMock()
-        mock_get.return_value = mock_response
+    with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = mock_response(SAMPLE_JOBS)
         
         jobs = await client.get_jobs(recipe_id=1, status="success", limit=10)
         
-        mock_get.assert_called_once_with(
-            "https://test.workato.com/api/jobs",
-            headers=client.headers,
+        mock_request.assert_called_once_with(
+            "GET",
+            "/jobs",
             params={"recipe_id": 1, "status": "success", "limit": 10}
         )
-        assert jobs == SAMPLE_JOBS 
\ No newline at end of file
+        assert jobs == SAMPLE_JOBS 
+
+def test_client_uses_base_url_and_headers(client):
+    """Test that the shared HTTP client is configured once with base URL and auth headers."""
+    assert str(client._client.base_url) == "https://test.workato.com/api/"
+    assert client._client.headers["Authorization"] == "Bearer test_token"
+
+@pytest.mark.asyncio
+async def test_async_context_manager_closes_client(client):
+    """Test that leaving the async context closes the shared HTTP client."""
+    async with client as entered:
+        assert entered is client
+    assert client._client.is_closed
+
+def test_client_enables_http2_with_tuned_limits():
+    """Test that the shared HTTP client negotiates HTTP/2 with a sized connection pool."""
+    with patch("httpx.AsyncHTTPTransport", wraps=httpx.AsyncHTTPTransport) as mock_transport:
+        client = WorkatoClient(api_token="test_token", base_url="https://test.workato.com/api")
+
+    transport_kwargs = mock_transport.call_args.kwargs
+    assert transport_kwargs["http2"] is True
+    assert transport_kwargs["limits"] is client._limits
+    assert client._limits.max_keepalive_connections == 100
+    assert client._limits.max_connections == 1000
+    assert client._client.timeout.connect == 5.0
+
+def test_pool_limits_are_configurable():
+    """Test that pool sizes can be overridden at construction."""
+    client = WorkatoClient(api_token="token", max_connections=50, max_keepalive_connections=10)
+    assert client._limits.max_connections == 50
+    assert client._limits.max_keepalive_connections == 10
+
+@pytest.mark.asyncio
+async def test_get_jobs_bulk(client):
+    """Test fetching many jobs concurrently preserves input order."""
+    with patch.object(client, "get_job_details", new_callable=AsyncMock) as mock_get_job:
+        mock_get_job.side_effect = lambda job_id: {"id": job_id}
+
+        jobs = await client.get_jobs_bulk([101, 102, 103], concurrency=2)
+
+        assert jobs == [{"id": 101}, {"id": 102}, {"id": 103}]
+        assert mock_get_job.call_count == 3
+
+@pytest.mark.asyncio
+async def test_list_all_lookup_table_rows(client):
+    """Test that lookup table pages are fetched until a short page is returned."""
+    pages = {1: [{"id": 1}, {"id": 2}], 2: [{"id": 3}, {"id": 4}], 3: [{"id": 5}]}
+    with patch.object(client, "list_lookup_table_rows", new_callable=AsyncMock) as mock_list_rows:
+        mock_list_rows.side_effect = lambda table_id, page, per_page, filters: pages.get(page, [])
+
+        rows = await client.list_all_lookup_table_rows(7, per_page=2, concurrency=4)
+
+        assert rows == [{"id": 1}, {"id": 2}, {"id": 3}, {"id": 4}, {"id": 5}]
+
+@pytest.mark.asyncio
+async def test_list_all_lookup_table_rows_caps_page_size(client):
+    """Test that an oversized per_page is capped so a full server page is not mistaken for the last."""
+    pages = {1: [{"id": n} for n in range(1000)], 2: [{"id": 1000}]}
+    with patch.object(client, "list_lookup_table_rows", new_callable=AsyncMock) as mock_list_rows:
+        mock_list_rows.side_effect = lambda table_id, page, per_page, filters: pages.get(page, [])
+
+        rows = await client.list_all_lookup_table_rows(7, per_page=5000, concurrency=2)
+
+        assert len(rows) == 1001
+        assert mock_list_rows.call_args_list[0].args == (7, 1, 1000, None)
+
+@pytest.mark.asyncio
+async def test_list_all_lookup_table_rows_rejects_zero_concurrency(client):
+    """Test that concurrency=0 is rejected instead of looping forever."""
+    with pytest.raises(ValueError):
+        await client.list_all_lookup_table_rows(7, concurrency=0)
+
+@pytest.mark.asyncio
+async def test_list_all_lookup_table_rows_as_models(client):
+    """Test that rows can be returned as slotted LookupTableRow instances."""
+    pages = {1: [{"id": 1, "data": {"code": "US"}}, {"id": 2, "data": {"code": "CA"}}], 2: []}
+    with patch.object(client, "list_lookup_table_rows", new_callable=AsyncMock) as mock_list_rows:
+        mock_list_rows.side_effect = lambda table_id, page, per_page, filters: pages.get(page, [])
+
+        rows = await client.list_all_lookup_table_rows(7, per_page=2, as_models=True)
+
+        assert rows == [LookupTableRow(1, {"code": "US"}), LookupTableRow(2, {"code": "CA"})]
+        assert not hasattr(rows[0], "__dict__")
+        assert orjson.loads(orjson.dumps(rows)) == pages[1]
+
+@pytest.mark.asyncio
+async def test_iter_lookup_table_rows_streams_items(client):
+    """Test that lookup table rows are parsed incrementally from a streamed body."""
+    body = orjson.dumps([{"id": 1, "data": {"code": "US"}}, {"id": 2, "data": {"code": "CA"}}])
+
+    def handler(request):
+        assert request.url.path == "/api/lookup_tables/7/rows"
+        return httpx.Response(200, content=body)
+
+    client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    rows = [row async for row in client.iter_lookup_table_rows(7)]
+
+    assert rows == [{"id": 1, "data": {"code": "US"}}, {"id": 2, "data": {"code": "CA"}}]
+
+@pytest.mark.asyncio
+async def test_download_package_streams_to_file(client, tmp_path):
+    """Test that a package download with a destination is written to disk in chunks."""
+    payload = b"PK" + b"\x00" * 200000
+
+    def handler(request):
+        assert request.url.path == "/api/packages/42/download"
+        return httpx.Response(200, content=payload)
+
+    client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    dest = tmp_path / "package.zip"
+
+    written = await client.download_package(42, dest)
+
+    assert written == len(payload)
+    assert dest.read_bytes() == payload
+
+@pytest.mark.asyncio
+async def test_download_package_follows_redirect_to_bytes(client):
+    """Test that a package download without a destination returns the redirected body."""
+    payload = b"PK" + b"\x02" * 1000
+
+    def handler(request):
+        if request.url.path == "/api/packages/42/download":
+            return httpx.Response(302, headers={"Location": "https://files.example.com/42.zip"})
+        return httpx.Response(200, content=payload)
+
+    client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+
+    assert await client.download_package(42) == payload
+
+@pytest.mark.asyncio
+async def test_download_package_returns_streamed_body(client):
+    """Test that a download with Content-Length returns exactly the streamed body."""
+    payload = b"PK" + bytes(range(256)) * 1000
+
+    def handler(request):
+        return httpx.Response(200, headers={"Content-Length": str(len(payload))}, stream=httpx.ByteStream(payload))
+
+    client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+
+    assert await client.download_package(42) == payload
+
+@pytest.mark.asyncio
+async def test_import_package_streams_from_file(client, tmp_path):
+    """Test that a package import from a path uploads the file content."""
+    payload = b"PK" + b"\x01" * 100000
+    source = tmp_path / "package.zip"
+    source.write_bytes(payload)
+
+    async def handler(request):
+        assert request.headers["Content-Type"] == "application/octet-stream"
+        assert request.headers["Content-Length"] == str(len(payload))
+        assert await request.aread() == payload
+        return httpx.Response(200, json={"id": 9, "status": "in_progress"})
+
+    client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+
+    result = await client.import_package(5, file=source)
+
+    assert result == {"id": 9, "status": "in_progress"}
+
+@pytest.mark.asyncio
+async def test_generated_endpoint_formats_path_and_wraps_body(client):
+    """Test that table-generated endpoints fill path placeholders and wrap the body."""
+    with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = mock_response({"id": 5})
+
+        result = await client.update_lookup_table_row(7, row_id=5, data={"code": "US"})
+
+        mock_request.assert_called_once_with(
+            "PUT",
+            "/lookup_tables/7/rows/5",
+            content=orjson.dumps({"data": {"code": "US"}}),
+            headers={"Content-Type": "application/json"}
+        )
+        assert result == {"id": 5}
+
+@pytest.mark.asyncio
+async def test_generated_endpoint_rejects_missing_arguments(client):
+    """Test that table-generated endpoints validate arguments against their signature."""
+    with pytest.raises(TypeError):
+        await client.get_lookup_table_row(7)
+
+@pytest.mark.asyncio
+async def test_retry_transport_honors_retry_after():
+    """Test that rate-limited requests are retried after the server's Retry-After delay."""
+    responses = [httpx.Response(429, headers={"Retry-After": "2"}), httpx.Response(200, json={"ok": True})]
+    transport = RetryTransport(httpx.MockTransport(lambda request: responses.pop(0)))
+
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        async with httpx.AsyncClient(transport=transport) as http:
+            response = await http.get("https://test.workato.com/api/recipes")
+
+    mock_sleep.assert_awaited_once_with(2.0)
+    assert response.status_code == 200
+
+@pytest.mark.asyncio
+async def test_retry_transport_does_not_retry_post_on_gateway_error():
+    """Test that non-idempotent requests are not retried when they may have been processed."""
+    calls = []
+
+    def handler(request):
+        calls.append(request)
+        return httpx.Response(502)
+
+    transport = RetryTransport(httpx.MockTransport(handler))
+
+    async with httpx.AsyncClient(transport=transport) as http:
+        response = await http.post("https://test.workato.com/api/recipes", content=b"{}")
+
+    assert response.status_code == 502
+    assert len(calls) == 1
+
+@pytest.mark.asyncio
+async def test_import_package_from_bytes_sends_octet_stream(client):
+    """Test that an in-memory package import overrides only the content type."""
+    async def handler(request):
+        assert request.headers["Content-Type"] == "application/octet-stream"
+        assert request.headers["Authorization"] == "Bearer test_token"
+        assert request.url.params["restart_recipes"] == "true"
+        assert await request.aread() == b"PK\x03\x04"
+        return httpx.Response(200, json={"id": 10})
+
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, headers=client.headers, transport=httpx.MockTransport(handler)
+    )
+
+    result = await client.import_package(5, b"PK\x03\x04", restart_recipes=True)
+
+    assert result == {"id": 10}
+
+@pytest.mark.asyncio
+async def test_test_recipe_without_input_sends_no_body(client):
+    """Test that a recipe test run without input data does not serialize an empty body."""
+    with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = mock_response({"job_id": 1})
+
+        await client.test_recipe(1)
+
+        mock_request.assert_called_once_with("POST", "/recipes/1/test_run")
+
+@pytest.mark.asyncio
+async def test_search_custom_connectors_uses_query_params(client):
+    """Test that connector search sends the title as a query parameter, not a GET body."""
+    with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = mock_response({"result": []})
+
+        await client.search_custom_connectors("My Connector")
+
+        mock_request.assert_called_once_with("GET", "/custom_connectors/search", params={"title": "My Connector"})
+
+def test_sync_client_shares_endpoint_table():
+    """Test that the sync client exposes the same endpoints over a blocking httpx.Client."""
+    def handler(request):
+        assert request.url.path == "/api/jobs"
+        assert request.url.params["status"] == "error"
+        return httpx.Response(200, json=SAMPLE_JOBS)
+
+    with patch.dict(os.environ, {"WORKATO_API_TOKEN": "test_token", "WORKATO_BASE_URL": "https://test.workato.com/api"}):
+        sync_client = WorkatoSyncClient()
+    sync_client._client = httpx.Client(base_url=sync_client.base_url, transport=httpx.MockTransport(handler))
+
+    with sync_client:
+        jobs = sync_client.get_jobs(status="error")
+
+    assert jobs == SAMPLE_JOBS
+    assert inspect.signature(WorkatoSyncClient.get_jobs) == inspect.signature(WorkatoClient.get_jobs)
+
+@pytest.mark.asyncio
+async def test_create_recipe_passes_code_string_through(client):
+    """Test that a recipe's JSON code string is sent once, as a string, with a JSON content type."""
+    code = json.dumps({"trigger": {"type": "webhook"}, "actions": []})
+
+    async def handler(request):
+        assert request.headers["Content-Type"] == "application/json"
+        assert orjson.loads(await request.aread()) == {"recipe": {"name": "New Recipe", "code": code}}
+        return httpx.Response(200, json={"id": 3})
+
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, headers=client.headers, transport=httpx.MockTransport(handler)
+    )
+
+    result = await client.create_recipe({"name": "New Recipe", "code": code})
+
+    assert result == {"id": 3}
+
+@pytest.mark.asyncio
+async def test_get_request_has_no_content_type(client):
+    """Test that bodyless requests do not carry a JSON content type."""
+    def handler(request):
+        assert "Content-Type" not in request.headers
+        return httpx.Response(200, json=SAMPLE_FOLDERS)
+
+    client._client = httpx.AsyncClient(
+        base_url=client.base_url, headers=client.headers, transport=httpx.MockTransport(handler)
+    )
+
+    assert await client.get_folders() == SAMPLE_FOLDERS
+
+@pytest.mark.asyncio
+async def test_update_recipe_encodes_structured_code_once(client):
+    """Test that structured recipe code is serialized to the JSON string Workato expects."""
+    code = {"trigger": {"type": "webhook"}, "actions": []}
+    with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = mock_response({"id": 1})
+
+        await client.update_recipe(1, {"name": "Recipe 1", "code": code})
+
+        sent = orjson.loads(mock_request.call_args.kwargs["content"])
+        assert sent == {"recipe": {"name": "Recipe 1", "code": orjson.dumps(code).decode()}}
+
+@pytest.mark.asyncio
+async def test_list_endpoints_are_cached_until_a_write(client):
+    """Test that cached list endpoints skip the network until a mutation invalidates them."""
+    with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = mock_response(SAMPLE_CONNECTIONS)
+
+        assert await client.get_connections() == SAMPLE_CONNECTIONS
+        assert await client.get_connections() == SAMPLE_CONNECTIONS
+        assert mock_request.call_count == 1
+
+        await client.delete_connection(301)
+        await client.get_connections()
+        assert mock_request.call_count == 3
+
+@pytest.mark.asyncio
+async def test_cache_entries_expire_and_can_be_cleared(client):
+    """Test that cached responses expire after the TTL and on explicit invalidation."""
+    with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = mock_response(SAMPLE_FOLDERS)
+
+        await client.get_folders()
+        client.invalidate_cache()
+        await client.get_folders()
+        assert mock_request.call_count == 2
+
+        with patch("time.monotonic", return_value=10**9):
+            await client.get_folders()
+        assert mock_request.call_count == 3
+
+@pytest.mark.asyncio
+async def test_shared_clients_reuse_one_pool():
+    """Test that shared clients reuse one HTTP client and only close it explicitly."""
+    first = WorkatoClient(api_token="token", base_url="https://test.workato.com/api", shared=True)
+    second = WorkatoClient(api_token="token", base_url="https://test.workato.com/api", shared=True)
+    other = WorkatoClient(api_token="other", base_url="https://test.workato.com/api", shared=True)
+
+    assert first._client is second._client
+    assert first._client is not other._client
+
+    await first.close()
+    assert not second._client.is_closed
+
+    await aclose_shared_clients()
+    assert second._client.is_closed and other._client.is_closed
+
+@pytest.mark.asyncio
+async def test_bulk_add_lookup_table_rows_reports_failures(client):
+    """Test that bulk row adds run every request and report failures by index."""
+    def handler(request):
+        row = orjson.loads(request.content)
+        if row["data"]["code"] == "XX":
+            return httpx.Response(422, json={"message": "invalid"})
+        return httpx.Response(200, json={"id": 1, "data": row["data"]})
+
+    client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    rows = [{"code": "US"}, {"code": "XX"}, {"code": "CA"}]
+
+    result = await client.bulk_add_lookup_table_rows(7, rows, concurrency=2)
+
+    assert [row["data"] for row in result["succeeded"]] == [{"code": "US"}, {"code": "CA"}]
+    assert [failure["index"] for failure in result["failed"]] == [1]
+
+@pytest.mark.asyncio
+async def test_writes_invalidate_cached_folder_assets(client):
+    """Test that a write in any namespace drops cached folder asset listings."""
+    with patch("httpx.AsyncClient.request", new_callable=AsyncMock) as mock_request:
+        mock_request.return_value = mock_response({"result": {"assets": []}})
+
+        await client.get_folder_assets(101)
+        await client.get_folder_assets(101)
+        assert mock_request.call_count == 1
+
+        await client.start_recipe(1)
+        await client.get_folder_assets(101)
+        assert mock_request.call_count == 3
+
+@pytest.mark.asyncio
+async def test_empty_and_non_json_bodies_decode_gracefully(client):
+    """Test that empty bodies decode to None and plain-text bodies to text."""
+    def handler(request):
+        if request.method == "DELETE":
+            return httpx.Response(204)
+        return httpx.Response(200, text="OK", headers={"Content-Type": "text/plain"})
+
+    client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+
+    assert await client.delete_recipe(1) is None
+    assert await client.start_recipe(1) == "OK"
+
+@pytest.mark.asyncio
+async def test_bulk_update_reports_malformed_rows(client):
+    """Test that a malformed bulk update lands in failed instead of aborting the batch."""
+    def handler(request):
+        return httpx.Response(200, json={"id": 1, "data": orjson.loads(request.content)["data"]})
+
+    client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    rows = [{"id": 1, "data": {"code": "US"}}, {"data": {}}]
+
+    result = await client.bulk_update_lookup_table_rows(7, rows)
+
+    assert len(result["succeeded"]) == 1
+    assert [failure["index"] for failure in result["failed"]] == [1]
+
+@pytest.mark.asyncio
+async def test_bulk_operations_reject_non_positive_concurrency(client):
+    """Test that a concurrency below 1 is rejected instead of hanging."""
+    with pytest.raises(ValueError):
+        await client.bulk_delete_lookup_table_rows(7, [1, 2], concurrency=0)
+
+@pytest.mark.asyncio
+async def test_read_in_flight_across_a_write_is_not_cached(client):
+    """Test that a cached GET overlapping a write does not store the pre-write response."""
+    release = asyncio.Event()
+
+    async def handler(request):
+        if request.method == "GET":
+            await release.wait()
+            return httpx.Response(200, json=[{"id": 1}])
+        return httpx.Response(200, json={"id": 2})
+
+    client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+
+    read = asyncio.create_task(client.get_connections())
+    await asyncio.sleep(0)
+    await client.create_connection({"name": "new"})
+    release.set()
+    await read
+
+    assert client._cache == {}
+
+@pytest.mark.asyncio
+async def test_package_import_invalidates_every_cached_listing(client):
+    """Test that importing a package drops cached listings of every asset type."""
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        return httpx.Response(200, json=[] if request.method == "GET" else {"id": 1, "status": "in_progress"})
+
+    client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+
+    await client.get_connections()
+    await client.get_folders()
+    await client.import_package(101, file_bytes=b"PK")
+    await client.get_connections()
+    await client.get_folders()
+
+    assert requests == [
+        "/api/connections", "/api/folders", "/api/packages/import/101", "/api/connections", "/api/folders"
+    ]
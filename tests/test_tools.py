@@ -0,0 +1,72 @@
+import pytest
+import httpx
+from mcp.server.fastmcp import FastMCP
+from mcp.server.fastmcp.exceptions import ToolError
+from workato_mcp.client import WorkatoClient
+from workato_mcp.tools._util import _project
+from workato_mcp.tools.connections import register_connection_tools
+from workato_mcp.tools.recipe_lifecycle_management import register_recipe_lifecycle_tools
+
+SAMPLE_CONNECTIONS = [
+    {"id": 1, "name": "Salesforce", "provider": "salesforce", "folder_id": 10},
+    {"id": 2, "name": "Slack", "provider": "slack", "folder_id": 10}
+]
+
+def test_project_bare_list():
+    """Test that each item of a bare list keeps only the requested fields."""
+    assert _project(SAMPLE_CONNECTIONS, ["id", "name"]) == [
+        {"id": 1, "name": "Salesforce"},
+        {"id": 2, "name": "Slack"}
+    ]
+
+def test_project_items_envelope():
+    """Test that items inside an envelope are trimmed and other envelope keys kept."""
+    result = {"items": SAMPLE_CONNECTIONS, "count": 2}
+    assert _project(result, ["id"], ("items",)) == {"items": [{"id": 1}, {"id": 2}], "count": 2}
+
+def test_project_nested_result_assets():
+    """Test that nested envelopes such as result.assets are trimmed."""
+    result = {"result": {"assets": [{"id": 1, "name": "a", "type": "recipe", "checked": True}]}}
+    assert _project(result, ["id", "type"], ("result", "assets")) == {"result": {"assets": [{"id": 1, "type": "recipe"}]}}
+
+def test_project_leaves_sibling_lists_intact():
+    """Test that only the item list is trimmed, not unrelated metadata beside it."""
+    result = {"items": [{"id": 1, "x": 2}], "meta": {"errors": [{"code": 1, "msg": "m"}]}}
+    assert _project(result, ["id"], ("items",)) == {"items": [{"id": 1}], "meta": {"errors": [{"code": 1, "msg": "m"}]}}
+
+def test_project_ignores_responses_of_another_shape():
+    """Test that a response without the expected item path is returned unchanged."""
+    assert _project(SAMPLE_CONNECTIONS, ["id"], ("items",)) is SAMPLE_CONNECTIONS
+
+def test_project_leaves_non_dict_items_and_empty_only():
+    """Test that non-dict items pass through and a missing projection is a no-op."""
+    assert _project([1, "two", {"id": 3, "x": 4}], ["id"]) == [1, "two", {"id": 3}]
+    assert _project(SAMPLE_CONNECTIONS, None) is SAMPLE_CONNECTIONS
+
+@pytest.mark.asyncio
+async def test_only_does_not_mutate_cached_response():
+    """Test that projecting a cached listing through a tool leaves the cached response intact."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        return httpx.Response(200, json=SAMPLE_CONNECTIONS)
+
+    client = WorkatoClient(api_token="test_token", base_url="https://test.workato.com/api")
+    client._client = httpx.AsyncClient(base_url=client.base_url, transport=httpx.MockTransport(handler))
+    mcp = FastMCP("test")
+    register_connection_tools(mcp, client)
+
+    await mcp.call_tool("list_connections", {"only": ["id"]})
+
+    assert await client.list_connections() == SAMPLE_CONNECTIONS
+    assert len(requests) == 1
+
+@pytest.mark.asyncio
+async def test_import_package_tool_names_its_own_parameters():
+    """Test that the import_package tool reports missing input in terms of its own schema."""
+    mcp = FastMCP("test")
+    register_recipe_lifecycle_tools(mcp, WorkatoClient(api_token="test_token", base_url="https://test.workato.com/api"))
+
+    with pytest.raises(ToolError, match="file_bytes or file_path"):
+        await mcp.call_tool("import_package", {"folder_id": 101})
@@ -1,708 +1,912 @@
 import os
-import json
+import string
+import time
+import random
+import asyncio
+import threading
+import inspect
+import functools
+import ssl
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
 import httpx
-from typing import Dict, List, Optional, Any, Union
+import orjson
+import ijson
+import aiofiles
+from typing import AsyncIterator, Awaitable, BinaryIO, Callable, Dict, Iterable, List, NamedTuple, Optional, Any, Union
 from dotenv import load_dotenv
-
-class WorkatoClient:
-    """Client for interacting with the Workato API."""
-    
-    def __init__(self, api_token: Optional[str] = None, base_url: Optional[str] = None):
+from workato_mcp.models import LookupTableRow
+
+# Read .env once per process rather than on every WorkatoClient construction.
+load_dotenv()
+
+# Endpoint paths, relative to the client's base URL. Templates with {placeholders}
+# are filled in per call with str.format / str.format_map.
+RECIPES = "/recipes"
+JOBS = "/jobs"
+FOLDERS = "/folders"
+CONNECTIONS = "/connections"
+LOOKUP_TABLES = "/lookup_tables"
+LOOKUP_TABLES_BATCH_DELETE = "/lookup_tables/batch_delete"
+EXPORT_MANIFESTS = "/export_manifests"
+FOLDER_ASSETS = "/export_manifests/folder_assets"
+CUSTOM_CONNECTORS = "/custom_connectors"
+CUSTOM_CONNECTORS_SEARCH = "/custom_connectors/search"
+GENERATE_SCHEMA_JSON = "/sdk/generate_schema/json"
+GENERATE_SCHEMA_CSV = "/sdk/generate_schema/csv"
+RECIPE = "/recipes/{recipe_id}"
+RECIPE_START = "/recipes/{recipe_id}/start"
+RECIPE_STOP = "/recipes/{recipe_id}/stop"
+RECIPE_TEST_RUN = "/recipes/{recipe_id}/test_run"
+RECIPE_COPY = "/recipes/{recipe_id}/copy"
+RECIPE_CONNECT = "/recipes/{recipe_id}/connect"
+RECIPE_RESET_TRIGGER = "/recipes/{recipe_id}/reset_trigger"
+RECIPE_POLL_NOW = "/recipes/{recipe_id}/poll_now"
+RECIPE_VERSIONS = "/recipes/{recipe_id}/versions"
+RECIPE_VERSION_DETAILS = "/recipes/{recipe_id}/versions/{version_id}"
+JOB = "/jobs/{job_id}"
+CONNECTION = "/connections/{connection_id}"
+CONNECTION_DISCONNECT = "/connections/{connection_id}/disconnect"
+EXPORT_MANIFEST = "/export_manifests/{manifest_id}"
+PACKAGE = "/packages/{package_id}"
+PACKAGE_DOWNLOAD = "/packages/{package_id}/download"
+PACKAGE_EXPORT = "/packages/export/{manifest_id}"
+PACKAGE_IMPORT = "/packages/import/{folder_id}"
+CUSTOM_CONNECTOR = "/custom_connectors/{connector_id}"
+CUSTOM_CONNECTOR_CODE = "/custom_connectors/{connector_id}/code"
+CUSTOM_CONNECTOR_RELEASE = "/custom_connectors/{connector_id}/release"
+CUSTOM_CONNECTOR_SHARE = "/custom_connectors/{connector_id}/share"
+LOOKUP_TABLE_ROWS = "/lookup_tables/{lookup_table_id}/rows"
+LOOKUP_TABLE_ROW = "/lookup_tables/{lookup_table_id}/rows/{row_id}"
+LOOKUP_TABLE_LOOKUP = "/lookup_tables/{lookup_table_id}/lookup"
+
+# Request builders for endpoints whose query string or body depends on optional
+# arguments. Each returns the keyword arguments for ``_request``; its parameters
+# become the generated method's parameters after any path placeholders.
+
+def _get_recipes_request(include_tags: bool = False) -> dict:
+    params = {}
+    if include_tags:
+        params["includes[]"] = "tags"
+    return {"params": params}
+
+def _recipe_request(recipe_data: Dict[str, Any]) -> dict:
+    # Workato expects ``code`` as a JSON string. A structured code object is dumped
+    # exactly once here, so callers never have to pre-encode (and double-escape) it.
+    code = recipe_data.get("code")
+    if isinstance(code, (dict, list)):
+        recipe_data = {**recipe_data, "code": orjson.dumps(code).decode()}
+    return {"json": {"recipe": recipe_data}}
+
+def _test_recipe_request(input_data: Optional[Dict[str, Any]] = None) -> dict:
+    return {"json": input_data or None}
+
+def _copy_recipe_request(folder_id: Optional[str] = None) -> dict:
+    return {"json": {"folder_id": folder_id} if folder_id else None}
+
+def _update_recipe_connection_request(adapter_name: str, connection_id: int) -> dict:
+    return {"json": {"adapter_name": adapter_name, "connection_id": connection_id}}
+
+def _get_recipe_versions_request(page: int = 1, per_page: int = 100) -> dict:
+    return {"params": {"page": page, "per_page": per_page}}
+
+def _get_jobs_request(recipe_id: Optional[Union[int, str]] = None,
+                      status: Optional[str] = None,
+                      limit: Optional[int] = None) -> dict:
+    params = {}
+    if recipe_id:
+        params["recipe_id"] = recipe_id
+    if status:
+        params["status"] = status
+    if limit:
+        params["limit"] = limit
+    return {"params": params}
+
+def _get_folder_assets_request(folder_id: Optional[int] = None, include_test_cases: bool = False, include_data: bool = False) -> dict:
+    params = {}
+    if folder_id is not None:
+        params["folder_id"] = folder_id
+    if include_test_cases:
+        params["include_test_cases"] = str(include_test_cases).lower()
+    if include_data:
+        params["include_data"] = str(include_data).lower()
+    return {"params": params}
+
+def _search_custom_connectors_request(title: str) -> dict:
+    return {"params": {"title": title}}
+
+def _generate_schema_from_csv_request(sample: str, col_sep: Optional[str] = None) -> dict:
+    payload = {"sample": sample}
+    if col_sep:
+        payload["col_sep"] = col_sep
+    return {"json": payload}
+
+def _list_connections_request(folder_id: Optional[str] = None, parent_id: Optional[str] = None, external_id: Optional[str] = None, include_runtime_connections: Optional[str] = None, includes: Optional[list] = None) -> dict:
+    params = {}
+    if folder_id:
+        params["folder_id"] = folder_id
+    if parent_id:
+        params["parent_id"] = parent_id
+    if external_id:
+        params["external_id"] = external_id
+    if include_runtime_connections:
+        params["include_runtime_connections"] = include_runtime_connections
+    if includes:
+        params["includes[]"] = includes
+    return {"params": params}
+
+def _disconnect_connection_request(force: bool = False) -> dict:
+    return {"json": {"force": force} if force else None}
+
+def _list_lookup_tables_request(page: int = 1, per_page: int = 100) -> dict:
+    return {"params": {"page": page, "per_page": per_page}}
+
+def _list_lookup_table_rows_request(page: int = 1, per_page: int = 500, filters: Optional[dict] = None) -> dict:
+    params = {"page": page, "per_page": per_page}
+    if filters:
+        params.update(filters)
+    return {"params": params}
+
+def _lookup_table_row_request(filters: dict) -> dict:
+    return {"params": filters}
+
+class _Endpoint(NamedTuple):
+    """Declarative description of a Workato endpoint.
+
+    Path placeholders become positional ``Union[int, str]`` arguments, in order. If
+    ``body`` names an argument, its value is sent as the JSON body, wrapped as
+    ``{body_key: value}`` when ``body_key`` is set. Endpoints with optional query
+    parameters or body fields name a ``build`` function instead. ``cached`` GETs are
+    served from the client's TTL cache.
+    """
+    name: str
+    method: str
+    path: str
+    doc: str
+    body: Optional[str] = None
+    body_type: Any = Dict[str, Any]
+    body_key: Optional[str] = None
+    build: Optional[Callable[..., dict]] = None
+    cached: bool = False
+
+_ENDPOINTS = [
+    _Endpoint("get_recipes", "GET", RECIPES, "Get a list of all recipes.", build=_get_recipes_request),
+    _Endpoint("get_recipe_details", "GET", RECIPE, "Get details for a specific recipe."),
+    _Endpoint("start_recipe", "PUT", RECIPE_START, "Start a recipe."),
+    _Endpoint("stop_recipe", "PUT", RECIPE_STOP, "Stop a recipe."),
+    _Endpoint("create_recipe", "POST", RECIPES, "Create a new recipe.", build=_recipe_request),
+    _Endpoint("update_recipe", "PUT", RECIPE, "Update an existing recipe.", build=_recipe_request),
+    _Endpoint("delete_recipe", "DELETE", RECIPE, "Delete a recipe."),
+    _Endpoint("test_recipe", "POST", RECIPE_TEST_RUN, "Test a recipe with optional input data.", build=_test_recipe_request),
+    _Endpoint("copy_recipe", "POST", RECIPE_COPY, "Copy a recipe, optionally into another folder.", build=_copy_recipe_request),
+    _Endpoint("reset_recipe_trigger", "POST", RECIPE_RESET_TRIGGER, "Reset the trigger for a recipe."),
+    _Endpoint("poll_recipe_now", "POST", RECIPE_POLL_NOW, "Activate a polling trigger for a recipe."),
+    _Endpoint("update_recipe_connection", "PUT", RECIPE_CONNECT, "Update the connection for a stopped recipe.", build=_update_recipe_connection_request),
+    _Endpoint("get_recipe_versions", "GET", RECIPE_VERSIONS, "Get all versions of a recipe.", build=_get_recipe_versions_request, cached=True),
+    _Endpoint("get_recipe_version_details", "GET", RECIPE_VERSION_DETAILS, "Get details of a specific recipe version."),
+    _Endpoint("update_recipe_version_comment", "PATCH", RECIPE_VERSION_DETAILS, "Update the comment for a specific recipe version.", body="comment", body_type=str, body_key="comment"),
+    _Endpoint("get_jobs", "GET", JOBS, "Get a list of jobs, optionally filtered by recipe ID and status.", build=_get_jobs_request),
+    _Endpoint("get_job_details", "GET", JOB, "Get details for a specific job."),
+    _Endpoint("get_folders", "GET", FOLDERS, "Get a list of all folders.", cached=True),
+    _Endpoint("get_connections", "GET", CONNECTIONS, "Get a list of all connections.", cached=True),
+    _Endpoint("get_connection_details", "GET", CONNECTION, "Get details for a specific connection."),
+    _Endpoint("list_connections", "GET", CONNECTIONS, "List all connections for the authenticated user.", build=_list_connections_request, cached=True),
+    _Endpoint("create_connection", "POST", CONNECTIONS, "Create a new connection.", body="connection"),
+    _Endpoint("update_connection", "PUT", CONNECTION, "Update a connection.", body="connection"),
+    _Endpoint("disconnect_connection", "POST", CONNECTION_DISCONNECT, "Disconnect a connection.", build=_disconnect_connection_request),
+    _Endpoint("delete_connection", "DELETE", CONNECTION, "Delete a connection."),
+    _Endpoint("get_folder_assets", "GET", FOLDER_ASSETS, "View assets in a folder for export manifests.", build=_get_folder_assets_request, cached=True),
+    _Endpoint("create_export_manifest", "POST", EXPORT_MANIFESTS, "Create an export manifest.", body="export_manifest", body_key="export_manifest"),
+    _Endpoint("update_export_manifest", "PUT", EXPORT_MANIFEST, "Update an export manifest.", body="export_manifest", body_key="export_manifest"),
+    _Endpoint("get_export_manifest", "GET", EXPORT_MANIFEST, "View an export manifest."),
+    _Endpoint("delete_export_manifest", "DELETE", EXPORT_MANIFEST, "Delete an export manifest."),
+    _Endpoint("export_package", "POST", PACKAGE_EXPORT, "Export a package based on a manifest."),
+    _Endpoint("get_package", "GET", PACKAGE, "Get details of an imported or exported package."),
+    _Endpoint("search_custom_connectors", "GET", CUSTOM_CONNECTORS_SEARCH, "Search for custom connectors by title.", build=_search_custom_connectors_request, cached=True),
+    _Endpoint("get_custom_connector_code", "GET", CUSTOM_CONNECTOR_CODE, "Fetch code for a custom connector by ID."),
+    _Endpoint("generate_schema_from_json", "POST", GENERATE_SCHEMA_JSON, "Generate Workato schema from a stringified JSON sample.", body="sample", body_type=str, body_key="sample"),
+    _Endpoint("generate_schema_from_csv", "POST", GENERATE_SCHEMA_CSV, "Generate Workato schema from a stringified CSV sample.", build=_generate_schema_from_csv_request),
+    _Endpoint("create_custom_connector", "POST", CUSTOM_CONNECTORS, "Create a custom connector.", body="connector"),
+    _Endpoint("release_custom_connector", "POST", CUSTOM_CONNECTOR_RELEASE, "Release the latest version of a custom connector."),
+    _Endpoint("share_custom_connector", "POST", CUSTOM_CONNECTOR_SHARE, "Share the most recently released version of a custom connector."),
+    _Endpoint("update_custom_connector", "PUT", CUSTOM_CONNECTOR, "Update a custom connector.", body="connector"),
+    _Endpoint("list_lookup_tables", "GET", LOOKUP_TABLES, "List all lookup tables for the authenticated user.", build=_list_lookup_tables_request, cached=True),
+    _Endpoint("list_lookup_table_rows", "GET", LOOKUP_TABLE_ROWS, "List rows from a lookup table, with optional filters and pagination.", build=_list_lookup_table_rows_request),
+    _Endpoint("lookup_table_row", "GET", LOOKUP_TABLE_LOOKUP, "Find the first row matching the given criteria in the lookup table.", build=_lookup_table_row_request),
+    _Endpoint("get_lookup_table_row", "GET", LOOKUP_TABLE_ROW, "Get a row from the lookup table by row ID."),
+    _Endpoint("add_lookup_table_row", "POST", LOOKUP_TABLE_ROWS, "Add a row to the lookup table.", body="data", body_key="data"),
+    _Endpoint("update_lookup_table_row", "PUT", LOOKUP_TABLE_ROW, "Update a row in the lookup table.", body="data", body_key="data"),
+    _Endpoint("delete_lookup_table_row", "DELETE", LOOKUP_TABLE_ROW, "Delete a row from the lookup table."),
+    _Endpoint("create_lookup_table", "POST", LOOKUP_TABLES, "Create a new lookup table.", body="lookup_table", body_key="lookup_table"),
+    _Endpoint("batch_delete_lookup_tables", "POST", LOOKUP_TABLES_BATCH_DELETE, "Delete lookup tables in batch.", body="ids", body_type=List[Union[int, str]], body_key="ids"),
+]
+
+def _make_endpoint(endpoint: _Endpoint, owner: str, is_async: bool):
+    """Build a client method from an endpoint description.
+
+    The same description yields a coroutine method for ``WorkatoClient`` and a plain
+    method for ``WorkatoSyncClient``; both delegate to the owner's ``_request``.
+    """
+    path_args = [field for _, field, _, _ in string.Formatter().parse(endpoint.path) if field]
+    parameters = [
+        inspect.Parameter(arg, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=Union[int, str])
+        for arg in path_args
+    ]
+    if endpoint.build:
+        parameters += inspect.signature(endpoint.build).parameters.values()
+    elif endpoint.body:
+        parameters.append(
+            inspect.Parameter(endpoint.body, inspect.Parameter.POSITIONAL_OR_KEYWORD, annotation=endpoint.body_type)
+        )
+    signature = inspect.Signature(parameters, return_annotation=Any)
+
+    def prepare(args: tuple, kwargs: dict) -> tuple:
+        arguments = signature.bind(*args, **kwargs).arguments
+        path = endpoint.path.format_map(arguments)
+        if endpoint.build:
+            return path, endpoint.build(**{k: v for k, v in arguments.items() if k not in path_args})
+        if not endpoint.body:
+            return path, {}
+        body = arguments[endpoint.body]
+        if endpoint.body_key:
+            body = {endpoint.body_key: body}
+        return path, {"json": body}
+
+    if is_async:
+        async def method(self, *args, **kwargs):
+            path, request = prepare(args, kwargs)
+            if not endpoint.cached:
+                return await self._request(endpoint.method, path, **request)
+            key = _cache_key(path, request)
+            result = self._cache_get(key)
+            if result is _CACHE_MISS:
+                generation = self._cache_generation(path)
+                result = await self._request(endpoint.method, path, **request)
+                self._cache_set(key, result, generation)
+            return result
+    else:
+        def method(self, *args, **kwargs):
+            path, request = prepare(args, kwargs)
+            if not endpoint.cached:
+                return self._request(endpoint.method, path, **request)
+            key = _cache_key(path, request)
+            result = self._cache_get(key)
+            if result is _CACHE_MISS:
+                generation = self._cache_generation(path)
+                result = self._request(endpoint.method, path, **request)
+                self._cache_set(key, result, generation)
+            return result
+
+    method.__name__ = endpoint.name
+    method.__qualname__ = f"{owner}.{endpoint.name}"
+    method.__doc__ = endpoint.doc
+    method.__signature__ = signature.replace(
+        parameters=[inspect.Parameter("self", inspect.Parameter.POSITIONAL_OR_KEYWORD), *parameters]
+    )
+    return method
+
+_CACHE_MISS = object()
+
+def _cache_key(path: str, request: dict) -> tuple:
+    return path, orjson.dumps(request.get("params"), option=orjson.OPT_SORT_KEYS)
+
+def _namespace(path: str) -> str:
+    """Top-level path segment that cache invalidation is tracked by, e.g. ``/connections``."""
+    return "/" + path.split("/")[1]
+
+@functools.lru_cache(maxsize=None)
+def _ssl_context() -> ssl.SSLContext:
+    """Build the TLS context once per process.
+
+    Loading the CA bundle dominates client construction, and an SSLContext can be
+    shared by any number of connection pools.
+    """
+    return httpx.create_ssl_context()
+
+PathOrFile = Union[str, os.PathLike, BinaryIO]
+
+_CHUNK_SIZE = 65536
+
+# Largest page the lookup table rows endpoint will serve
+_LOOKUP_TABLE_ROWS_MAX_PER_PAGE = 1000
+
+# Merged by httpx over the client's default headers, which only carry Authorization;
+# bodyless requests such as GETs go out without a Content-Type.
+_JSON_HEADERS = {"Content-Type": "application/json"}
+_OCTET_STREAM_HEADERS = {"Content-Type": "application/octet-stream"}
+
+async def _iter_file_chunks(file: PathOrFile) -> AsyncIterator[bytes]:
+    """Yield a file's content in fixed-size chunks, from a path or a binary file object."""
+    if isinstance(file, (str, os.PathLike)):
+        async with aiofiles.open(file, "rb") as f:
+            while chunk := await f.read(_CHUNK_SIZE):
+                yield chunk
+    else:
+        while chunk := file.read(_CHUNK_SIZE):
+            yield chunk
+
+class RetryTransport(httpx.BaseTransport, httpx.AsyncBaseTransport):
+    """Transport wrapper that retries rate-limited and transiently failing requests.
+
+    Wraps either a sync or an async transport, so it serves both ``WorkatoClient``
+    and ``WorkatoSyncClient``.
+
+    Responses with a retryable status are retried up to ``max_retries`` times, waiting
+    for the server's ``Retry-After`` when present and otherwise for a jittered
+    exponential backoff. POST and PATCH are only retried on 429 and 503, which signal
+    the request was not processed. Streamed request bodies cannot be replayed and are
+    never retried.
+    """
+
+    RETRY_STATUSES = frozenset({429, 502, 503, 504})
+    UNPROCESSED_STATUSES = frozenset({429, 503})
+    IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+    def __init__(self, transport: Union[httpx.BaseTransport, httpx.AsyncBaseTransport], max_retries: int = 3,
+                 backoff_factor: float = 0.5, max_backoff: float = 30.0):
+        self._transport = transport
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            response = self._transport.handle_request(request)
+            if attempt >= self.max_retries or not self._should_retry(request, response):
+                return response
+            delay = self._retry_delay(response, attempt)
+            response.close()
+            time.sleep(delay)
+            attempt += 1
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        attempt = 0
+        while True:
+            response = await self._transport.handle_async_request(request)
+            if attempt >= self.max_retries or not self._should_retry(request, response):
+                return response
+            delay = self._retry_delay(response, attempt)
+            await response.aclose()
+            await asyncio.sleep(delay)
+            attempt += 1
+
+    def close(self) -> None:
+        self._transport.close()
+
+    async def aclose(self) -> None:
+        await self._transport.aclose()
+
+    def _should_retry(self, request: httpx.Request, response: httpx.Response) -> bool:
+        if not isinstance(request.stream, httpx.ByteStream):
+            return False
+        if request.method in self.IDEMPOTENT_METHODS:
+            return response.status_code in self.RETRY_STATUSES
+        return response.status_code in self.UNPROCESSED_STATUSES
+
+    def _retry_delay(self, response: httpx.Response, attempt: int) -> float:
+        retry_after = response.headers.get("Retry-After")
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = (parsedate_to_datetime(retry_after) - datetime.now(timezone.utc)).total_seconds()
+                except (TypeError, ValueError):
+                    delay = None
+            if delay is not None:
+                return min(max(delay, 0.0), self.max_backoff)
+        return random.uniform(0, min(self.backoff_factor * 2 ** attempt, self.max_backoff))
+
+class _WorkatoClientBase:
+    """Configuration shared by the async and sync Workato clients."""
+
+    CACHE_MAXSIZE = 256
+
+    def __init__(
+        self,
+        api_token: Optional[str] = None,
+        base_url: Optional[str] = None,
+        cache_ttl: float = 30.0,
+        max_connections: int = 1000,
+        max_keepalive_connections: int = 100,
+    ):
         """Initialize the Workato API client.
         
         Args:
             api_token: The API token for authentication. If not provided, will try to load from environment.
             base_url: The base URL for Workato API. If not provided, will try to load from environment.
+            cache_ttl: Seconds to keep responses of cached read endpoints (folders, connections,
+                lookup tables, folder assets, recipe versions, connector search). Set to 0 to
+                disable caching. Cached responses are the same objects for every caller, so
+                treat them as read-only.
+            max_connections: Upper bound on concurrent connections in the pool.
+            max_keepalive_connections: Idle connections kept open for reuse.
         """
-        load_dotenv()
-        
         self.api_token = api_token or os.getenv("WORKATO_API_TOKEN")
         if not self.api_token:
             raise ValueError("API token is required. Provide it as a parameter or set WORKATO_API_TOKEN environment variable.")
         
         self.base_url = base_url or os.getenv("WORKATO_BASE_URL", "https://www.workato.com/api")
         
-        self.headers = {
-            "Authorization": f"Bearer {self.api_token}",
-            "Content-Type": "application/json"
-        }
-    
-    async def get_recipes(self, include_tags: bool = False) -> List[Dict[str, Any]]:
-        """Get a list of all recipes.
-        
-        Args:
-            include_tags: Whether to include tags in the response.
-            
-        Returns:
-            List of recipe objects.
+        self.headers = {"Authorization": f"Bearer {self.api_token}"}
+
+        self._limits = httpx.Limits(
+            max_keepalive_connections=max_keepalive_connections,
+            max_connections=max_connections,
+            keepalive_expiry=60
+        )
+        self._timeout = httpx.Timeout(30.0, connect=5.0)
+
+        self.cache_ttl = cache_ttl
+        self._cache: Dict[tuple, tuple] = {}
+        # Bumped on every invalidation, so a read that was in flight across one is not stored
+        self._cache_epoch = 0
+        self._cache_generations: Dict[str, int] = {}
+
+    @staticmethod
+    def _encode(json: Any, kwargs: dict) -> dict:
+        """Pre-serialize a JSON body to bytes and label it, so httpx sends it as-is."""
+        if json is not None:
+            kwargs["content"] = orjson.dumps(json)
+            kwargs.setdefault("headers", _JSON_HEADERS)
+        return kwargs
+
+    @staticmethod
+    def _decode(response: httpx.Response) -> Any:
+        """Parse a response body with orjson.
+
+        Empty bodies (e.g. 204 on delete) decode to None and non-JSON bodies are
+        returned as text rather than raising.
         """
-        params = {}
-        if include_tags:
-            params["includes[]"] = "tags"
-            
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/recipes",
-                headers=self.headers,
-                params=params
-            )
-            response.raise_for_status()
-            return response.json()
-    
-    async def get_recipe_details(self, recipe_id: Union[int, str]) -> Dict[str, Any]:
-        """Get details for a specific recipe.
-        
-        Args:
-            recipe_id: The ID of the recipe to retrieve.
-            
-        Returns:
-            Recipe object with details.
+        response.raise_for_status()
+        if not response.content:
+            return None
+        try:
+            return orjson.loads(response.content)
+        except orjson.JSONDecodeError:
+            return response.text
+
+    def invalidate_cache(self, prefix: Optional[str] = None) -> None:
+        """Drop cached responses, optionally only those whose path starts with ``prefix``.
+
+        Any non-GET request through the client already invalidates its path's top-level
+        namespace (e.g. creating a connection clears cached ``/connections`` lists), as
+        well as cached folder asset listings. Package imports clear everything.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/recipes/{recipe_id}",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
+        if prefix is None:
+            self._cache_epoch += 1
+            self._cache.clear()
+            return
+        namespace = _namespace(prefix)
+        self._cache_generations[namespace] = self._cache_generations.get(namespace, 0) + 1
+        for key in [key for key in self._cache if key[0].startswith(prefix)]:
+            del self._cache[key]
+
+    def _cache_generation(self, path: str) -> tuple:
+        return self._cache_epoch, self._cache_generations.get(_namespace(path), 0)
+
+    def _cache_get(self, key: tuple) -> Any:
+        entry = self._cache.get(key)
+        if entry is None:
+            return _CACHE_MISS
+        expires, value = entry
+        if expires <= time.monotonic():
+            del self._cache[key]
+            return _CACHE_MISS
+        return value
+
+    def _cache_set(self, key: tuple, value: Any, generation: tuple) -> None:
+        """Store ``value`` unless its namespace was invalidated since ``generation`` was read."""
+        if self.cache_ttl <= 0 or generation != self._cache_generation(key[0]):
+            return
+        self._cache.pop(key, None)
+        self._cache[key] = (time.monotonic() + self.cache_ttl, value)
+        if len(self._cache) > self.CACHE_MAXSIZE:
+            del self._cache[next(iter(self._cache))]
+
+    def _invalidate_on_write(self, method: str, path: str) -> None:
+        if method == "GET":
+            return
+        if path.startswith(PACKAGE_IMPORT.format(folder_id="")):
+            # An import can create assets of every type, so nothing cached is safe
+            self.invalidate_cache()
+        else:
+            self.invalidate_cache(_namespace(path))
+            # Folder asset listings span recipes, connections and lookup tables alike
+            self.invalidate_cache(FOLDER_ASSETS)
+
+_SHARED_CLIENTS: Dict[tuple, httpx.AsyncClient] = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+async def aclose_shared_clients() -> None:
+    """Close every process-wide client handed out to ``WorkatoClient(shared=True)``.
+
+    Call this once on shutdown (e.g. from the server's lifespan hook); shared
+    clients are otherwise left open for the life of the process.
+    """
+    with _SHARED_CLIENTS_LOCK:
+        clients = list(_SHARED_CLIENTS.values())
+        _SHARED_CLIENTS.clear()
+    for client in clients:
+        await client.aclose()
+
+
+class WorkatoClient(_WorkatoClientBase):
+    """Client for interacting with the Workato API.
+
+    The client keeps a single pooled HTTP/2 connection to Workato. Use it as an
+    async context manager (``async with WorkatoClient() as client:``) or call
+    ``close()`` when done so the connection is torn down cleanly.
+
+    With ``shared=True`` the connection pool is instead shared by every shared
+    client for the same base URL and token in the process; ``close()`` then leaves
+    it open and ``aclose_shared_clients()`` tears it down.
+    """
     
-    async def start_recipe(self, recipe_id: Union[int, str]) -> Dict[str, Any]:
-        """Start a recipe.
-        
-        Args:
-            recipe_id: The ID of the recipe to start.
-            
-        Returns:
-            Response object indicating success or failure.
+    def __init__(
+        self,
+        api_token: Optional[str] = None,
+        base_url: Optional[str] = None,
+        cache_ttl: float = 30.0,
+        max_connections: int = 1000,
+        max_keepalive_connections: int = 100,
+        shared: bool = False,
+    ):
+        super().__init__(api_token, base_url, cache_ttl, max_connections, max_keepalive_connections)
+        self.shared = shared
+        if shared:
+            key = (self.base_url, self.headers["Authorization"])
+            with _SHARED_CLIENTS_LOCK:
+                client = _SHARED_CLIENTS.get(key)
+                if client is None or client.is_closed:
+                    client = _SHARED_CLIENTS[key] = self._build_client()
+            self._client = client
+        else:
+            self._client = self._build_client()
+
+    def _build_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=self._timeout,
+            transport=RetryTransport(
+                httpx.AsyncHTTPTransport(http2=True, verify=_ssl_context(), limits=self._limits, retries=3)
+            ),
+        )
+
+    async def close(self) -> None:
+        """Close the underlying HTTP client and release pooled connections.
+
+        Shared clients are left open; see ``aclose_shared_clients()``.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"{self.base_url}/recipes/{recipe_id}/start",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
-    
-    async def stop_recipe(self, recipe_id: Union[int, str]) -> Dict[str, Any]:
-        """Stop a recipe.
-        
+        if not self.shared:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> "WorkatoClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _request(self, method: str, path: str, json: Any = None, **kwargs) -> Any:
+        """Send a request through the shared HTTP client and return the decoded JSON body.
+
+        JSON bodies are encoded and responses decoded with orjson rather than the
+        stdlib ``json`` module httpx would otherwise use. A ``json`` of None sends
+        no body at all.
+
         Args:
-            recipe_id: The ID of the recipe to stop.
-            
+            method: HTTP method (e.g., "GET", "POST").
+            path: API path relative to the base URL.
+            json: Optional JSON-serializable request body.
+            **kwargs: Additional arguments passed through to httpx (params, content, headers).
+
         Returns:
-            Response object indicating success or failure.
+            Decoded JSON response.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"{self.base_url}/recipes/{recipe_id}/stop",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
-    
-    async def test_recipe(self, recipe_id: Union[int, str], input_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Test a recipe with optional input data.
-        
+        response = await self._client.request(method, path, **self._encode(json, kwargs))
+        self._invalidate_on_write(method, path)
+        return self._decode(response)
+
+    async def _gather_bounded(self, coros: Iterable[Awaitable[Any]], concurrency: int = 16,
+                              return_exceptions: bool = False) -> List[Any]:
+        """Run awaitables concurrently, with at most ``concurrency`` in flight at once.
+
         Args:
-            recipe_id: The ID of the recipe to test.
-            input_data: Input data for testing the recipe.
-            
+            coros: Awaitables to run.
+            concurrency: Maximum number of requests in flight.
+            return_exceptions: Return failures in place of results instead of raising the first one.
+
         Returns:
-            Test run results.
+            Results in the same order as ``coros``.
+
+        Raises:
+            ValueError: If ``concurrency`` is below 1, which would never let a request start.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/recipes/{recipe_id}/test_run",
-                headers=self.headers,
-                json=input_data or {}
-            )
-            response.raise_for_status()
-            return response.json()
-    
-    async def create_recipe(self, recipe_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a new recipe.
-        
-        Args:
-            recipe_data: Recipe configuration data.
-            
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def run(coro: Awaitable[Any]) -> Any:
+            async with semaphore:
+                return await coro
+
+        return await asyncio.gather(*(run(coro) for coro in coros), return_exceptions=return_exceptions)
+
+    async def _gather_outcomes(self, coros: Iterable[Awaitable[Any]], concurrency: int) -> Dict[str, List[Any]]:
+        """Run awaitables concurrently and split their results into successes and failures.
+
         Returns:
-            Created recipe object.
+            ``{"succeeded": [...], "failed": [{"index": i, "error": "..."}]}``, where
+            ``index`` is the position of the failed awaitable in ``coros``.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/recipes",
-                headers=self.headers,
-                json={"recipe": recipe_data}
-            )
-            response.raise_for_status()
-            return response.json()
-    
-    async def update_recipe(self, recipe_id: Union[int, str], recipe_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Update an existing recipe.
-        
-        Args:
-            recipe_id: The ID of the recipe to update.
-            recipe_data: Recipe configuration data.
-            
-        Returns:
-            Updated recipe object.
+        outcome: Dict[str, List[Any]] = {"succeeded": [], "failed": []}
+        results = await self._gather_bounded(coros, concurrency, return_exceptions=True)
+        for index, result in enumerate(results):
+            if isinstance(result, Exception):
+                outcome["failed"].append({"index": index, "error": str(result)})
+            else:
+                outcome["succeeded"].append(result)
+        return outcome
+
+    async def _iter_items(self, path: str, params: Optional[dict] = None) -> AsyncIterator[Any]:
+        """Stream a JSON array response, yielding one element at a time.
+
+        The body is tokenized incrementally with ijson (using the C yajl2 backend
+        when it is installed) so only the current element is held in memory.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"{self.base_url}/recipes/{recipe_id}",
-                headers=self.headers,
-                json={"recipe": recipe_data}
-            )
-            response.raise_for_status()
-            return response.json()
-    
-    async def delete_recipe(self, recipe_id: Union[int, str]) -> Dict[str, Any]:
-        """Delete a recipe.
+        items = ijson.sendable_list()
+        parser = ijson.items_coro(items, "item", use_float=True)
+        async with self._client.stream("GET", path, params=params) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                parser.send(chunk)
+                for item in items:
+                    yield item
+                del items[:]
+        parser.close()
+        for item in items:
+            yield item
+
+    async def get_recipes_bulk(self, recipe_ids: Iterable[Union[int, str]], concurrency: int = 16) -> List[Dict[str, Any]]:
+        """Get details for many recipes concurrently.
         
         Args:
-            recipe_id: The ID of the recipe to delete.
+            recipe_ids: The IDs of the recipes to retrieve.
+            concurrency: Maximum number of requests in flight.
             
         Returns:
-            Response object indicating success or failure.
+            Recipe objects, in the same order as ``recipe_ids``.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{self.base_url}/recipes/{recipe_id}",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
-    
-    async def get_jobs(self, recipe_id: Optional[Union[int, str]] = None, 
-                       status: Optional[str] = None, 
-                       limit: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Get a list of jobs, optionally filtered by recipe ID and status.
+        return await self._gather_bounded(
+            (self.get_recipe_details(recipe_id) for recipe_id in recipe_ids),
+            concurrency
+        )
+
+    async def iter_jobs(self, recipe_id: Optional[Union[int, str]] = None,
+                        status: Optional[str] = None,
+                        limit: Optional[int] = None) -> AsyncIterator[Dict[str, Any]]:
+        """Stream jobs one at a time instead of buffering the whole list.
         
         Args:
             recipe_id: Filter jobs by recipe ID.
             status: Filter jobs by status (e.g., "success", "error").
             limit: Maximum number of jobs to return.
             
-        Returns:
-            List of job objects.
+        Yields:
+            Job objects.
         """
-        params = {}
-        if recipe_id:
-            params["recipe_id"] = recipe_id
-        if status:
-            params["status"] = status
-        if limit:
-            params["limit"] = limit
-            
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/jobs",
-                headers=self.headers,
-                params=params
-            )
-            response.raise_for_status()
-            return response.json()
-    
-    async def get_job_details(self, job_id: Union[int, str]) -> Dict[str, Any]:
-        """Get details for a specific job.
+        params = _get_jobs_request(recipe_id, status, limit)["params"]
+        async for job in self._iter_items(JOBS, params):
+            yield job
+
+    async def get_jobs_bulk(self, job_ids: Iterable[Union[int, str]], concurrency: int = 16) -> List[Dict[str, Any]]:
+        """Get details for many jobs concurrently.
         
         Args:
-            job_id: The ID of the job to retrieve.
+            job_ids: The IDs of the jobs to retrieve.
+            concurrency: Maximum number of requests in flight.
             
         Returns:
-            Job object with details.
+            Job objects, in the same order as ``job_ids``.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/jobs/{job_id}",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
-    
-    async def get_folders(self) -> List[Dict[str, Any]]:
-        """Get a list of all folders.
-        
-        Returns:
-            List of folder objects.
+        return await self._gather_bounded(
+            (self.get_job_details(job_id) for job_id in job_ids),
+            concurrency
+        )
+
+    async def import_package(self, folder_id: Union[int, str], file_bytes: Optional[bytes] = None, restart_recipes: bool = False, include_tags: bool = False, folder_id_for_home_assets: Optional[str] = None, file: Optional[PathOrFile] = None) -> dict:
+        """Import a package into a folder.
+
+        Pass the zip either in memory as ``file_bytes`` or as ``file`` (a path or a
+        binary file object), in which case it is streamed in 64 KiB chunks.
+        ``file_bytes`` keeps the whole package in memory, so reserve it for small ones.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/folders",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
-    
-    async def get_connections(self) -> List[Dict[str, Any]]:
-        """Get a list of all connections.
-        
+        if (file_bytes is None) == (file is None):
+            raise ValueError("Provide exactly one of file_bytes or file.")
+        params = {"restart_recipes": str(restart_recipes).lower(), "include_tags": str(include_tags).lower()}
+        if folder_id_for_home_assets:
+            params["folder_id_for_home_assets"] = folder_id_for_home_assets
+        headers = _OCTET_STREAM_HEADERS
+        if file is not None:
+            if isinstance(file, (str, os.PathLike)):
+                headers = {**_OCTET_STREAM_HEADERS, "Content-Length": str(os.path.getsize(file))}
+            content = _iter_file_chunks(file)
+        else:
+            content = file_bytes
+        return await self._request(
+            "POST",
+            PACKAGE_IMPORT.format(folder_id=folder_id),
+            headers=headers,
+            params=params,
+            content=content
+        )
+
+    async def download_package(self, package_id: Union[int, str], dest: Optional[PathOrFile] = None) -> Union[bytes, int]:
+        """Download a package zip file by package ID.
+
+        Without ``dest`` the raw bytes are returned. With ``dest`` (a path or a binary
+        file object) the zip is streamed to it in 64 KiB chunks and the number of
+        bytes written is returned, so memory use stays constant.
+        """
+        path = PACKAGE_DOWNLOAD.format(package_id=package_id)
+        written = 0
+        async with self._client.stream("GET", path, follow_redirects=True) as response:
+            response.raise_for_status()
+            if dest is None:
+                return await response.aread()
+            if isinstance(dest, (str, os.PathLike)):
+                async with aiofiles.open(dest, "wb") as f:
+                    async for chunk in response.aiter_bytes(_CHUNK_SIZE):
+                        await f.write(chunk)
+                        written += len(chunk)
+            else:
+                async for chunk in response.aiter_bytes(_CHUNK_SIZE):
+                    dest.write(chunk)
+                    written += len(chunk)
+        return written
+
+    async def iter_lookup_table_rows(self, lookup_table_id: Union[int, str], page: int = 1, per_page: int = 500, filters: Optional[dict] = None) -> AsyncIterator[dict]:
+        """Stream rows from a lookup table page one row at a time."""
+        params = _list_lookup_table_rows_request(page, per_page, filters)["params"]
+        async for row in self._iter_items(LOOKUP_TABLE_ROWS.format(lookup_table_id=lookup_table_id), params):
+            yield row
+
+    async def list_all_lookup_table_rows(self, lookup_table_id: Union[int, str], per_page: int = 500, filters: Optional[dict] = None, concurrency: int = 8,
+                                         as_models: bool = False) -> list:
+        """List every row of a lookup table, fetching pages concurrently.
+
+        The first page is fetched on its own; if it is full, the following pages are
+        requested ``concurrency`` at a time until a short page marks the end. With
+        ``as_models`` each page is converted to slotted ``LookupTableRow`` instances as
+        it arrives, which keeps the memory held by large tables down.
+
+        ``per_page`` is capped at the API maximum of 1000, since a page the server
+        silently shortened would otherwise look like the last one.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1.")
+        if per_page < 1:
+            raise ValueError("per_page must be at least 1.")
+        per_page = min(per_page, _LOOKUP_TABLE_ROWS_MAX_PER_PAGE)
+        adapt = (lambda page: list(map(LookupTableRow.from_dict, page))) if as_models else list
+        page_rows = await self.list_lookup_table_rows(lookup_table_id, 1, per_page, filters)
+        rows = adapt(page_rows)
+        if len(page_rows) < per_page:
+            return rows
+        next_page = 2
+        while True:
+            pages = await self._gather_bounded(
+                (self.list_lookup_table_rows(lookup_table_id, page, per_page, filters)
+                 for page in range(next_page, next_page + concurrency)),
+                concurrency
+            )
+            for page_rows in pages:
+                rows.extend(adapt(page_rows))
+                if len(page_rows) < per_page:
+                    return rows
+            next_page += concurrency
+
+    async def bulk_add_lookup_table_rows(self, lookup_table_id: Union[int, str], rows: List[Dict[str, Any]],
+                                         concurrency: int = 20) -> Dict[str, List[Any]]:
+        """Add many rows to a lookup table concurrently.
+
+        Args:
+            lookup_table_id: The ID of the lookup table.
+            rows: Row data dictionaries to add.
+            concurrency: Maximum number of requests in flight.
+
         Returns:
-            List of connection objects.
+            Added rows under ``succeeded`` and per-row errors under ``failed``.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/connections",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
-    
-    async def get_connection_details(self, connection_id: Union[int, str]) -> Dict[str, Any]:
-        """Get details for a specific connection.
-        
+        return await self._gather_outcomes(
+            (self.add_lookup_table_row(lookup_table_id, row) for row in rows),
+            concurrency
+        )
+
+    async def bulk_update_lookup_table_rows(self, lookup_table_id: Union[int, str], rows: List[Dict[str, Any]],
+                                            concurrency: int = 20) -> Dict[str, List[Any]]:
+        """Update many lookup table rows concurrently.
+
         Args:
-            connection_id: The ID of the connection to retrieve.
-            
+            lookup_table_id: The ID of the lookup table.
+            rows: Updates, each ``{"id": row_id, "data": {...}}``.
+            concurrency: Maximum number of requests in flight.
+
         Returns:
-            Connection object with details.
+            Updated rows under ``succeeded`` and per-row errors under ``failed``.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/connections/{connection_id}",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
-    
-    async def copy_recipe(self, recipe_id: Union[int, str], folder_id: Optional[str] = None) -> Dict[str, Any]:
-        payload = {}
-        if folder_id:
-            payload["folder_id"] = folder_id
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/recipes/{recipe_id}/copy",
-                headers=self.headers,
-                json=payload if payload else None
-            )
-            response.raise_for_status()
-            return response.json()
+        async def update(row: Dict[str, Any]) -> Any:
+            # Checked per row so a malformed update is reported in ``failed``, not raised
+            if not isinstance(row, dict) or "id" not in row or "data" not in row:
+                raise ValueError("Row updates need 'id' and 'data' keys.")
+            return await self.update_lookup_table_row(lookup_table_id, row["id"], row["data"])
 
-    async def reset_recipe_trigger(self, recipe_id: Union[int, str]) -> Dict[str, Any]:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/recipes/{recipe_id}/reset_trigger",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def update_recipe_connection(self, recipe_id: Union[int, str], adapter_name: str, connection_id: int) -> Dict[str, Any]:
-        payload = {"adapter_name": adapter_name, "connection_id": connection_id}
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"{self.base_url}/recipes/{recipe_id}/connect",
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
+        return await self._gather_outcomes((update(row) for row in rows), concurrency)
 
-    async def poll_recipe_now(self, recipe_id: Union[int, str]) -> Dict[str, Any]:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/recipes/{recipe_id}/poll_now",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def get_recipe_versions(self, recipe_id: Union[int, str], page: int = 1, per_page: int = 100) -> Dict[str, Any]:
-        params = {"page": page, "per_page": per_page}
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/recipes/{recipe_id}/versions",
-                headers=self.headers,
-                params=params
-            )
-            response.raise_for_status()
-            return response.json()
+    async def bulk_delete_lookup_table_rows(self, lookup_table_id: Union[int, str], row_ids: List[Union[int, str]],
+                                            concurrency: int = 20) -> Dict[str, List[Any]]:
+        """Delete many lookup table rows concurrently.
 
-    async def get_recipe_version_details(self, recipe_id: Union[int, str], version_id: Union[int, str]) -> Dict[str, Any]:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/recipes/{recipe_id}/versions/{version_id}",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def update_recipe_version_comment(self, recipe_id: Union[int, str], version_id: Union[int, str], comment: str) -> Dict[str, Any]:
-        payload = {"comment": comment}
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(
-                f"{self.base_url}/recipes/{recipe_id}/versions/{version_id}",
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def get_folder_assets(self, folder_id: Optional[int] = None, include_test_cases: bool = False, include_data: bool = False) -> dict:
-        """View assets in a folder for export manifests."""
-        params = {}
-        if folder_id is not None:
-            params["folder_id"] = folder_id
-        if include_test_cases:
-            params["include_test_cases"] = str(include_test_cases).lower()
-        if include_data:
-            params["include_data"] = str(include_data).lower()
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/export_manifests/folder_assets",
-                headers=self.headers,
-                params=params
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def create_export_manifest(self, export_manifest: dict) -> dict:
-        """Create an export manifest."""
-        payload = {"export_manifest": export_manifest}
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/export_manifests",
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def update_export_manifest(self, manifest_id: Union[int, str], export_manifest: dict) -> dict:
-        """Update an export manifest."""
-        payload = {"export_manifest": export_manifest}
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"{self.base_url}/export_manifests/{manifest_id}",
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def get_export_manifest(self, manifest_id: Union[int, str]) -> dict:
-        """View an export manifest."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/export_manifests/{manifest_id}",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def delete_export_manifest(self, manifest_id: Union[int, str]) -> dict:
-        """Delete an export manifest."""
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{self.base_url}/export_manifests/{manifest_id}",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def export_package(self, manifest_id: Union[int, str]) -> dict:
-        """Export a package based on a manifest."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/packages/export/{manifest_id}",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
+        Args:
+            lookup_table_id: The ID of the lookup table.
+            row_ids: The IDs of the rows to delete.
+            concurrency: Maximum number of requests in flight.
 
-    async def import_package(self, folder_id: Union[int, str], file_bytes: bytes, restart_recipes: bool = False, include_tags: bool = False, folder_id_for_home_assets: Optional[str] = None) -> dict:
-        """Import a package into a folder. file_bytes should be the content of the zip file."""
-        params = {"restart_recipes": str(restart_recipes).lower(), "include_tags": str(include_tags).lower()}
-        if folder_id_for_home_assets:
-            params["folder_id_for_home_assets"] = folder_id_for_home_assets
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/packages/import/{folder_id}",
-                headers={**self.headers, "Content-Type": "application/octet-stream"},
-                params=params,
-                content=file_bytes
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def get_package(self, package_id: Union[int, str]) -> dict:
-        """Get details of an imported or exported package."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/packages/{package_id}",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def download_package(self, package_id: Union[int, str]) -> bytes:
-        """Download a package zip file by package ID. Returns the raw bytes."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/packages/{package_id}/download",
-                headers=self.headers,
-                follow_redirects=True
-            )
-            response.raise_for_status()
-            return response.content
-
-    async def search_custom_connectors(self, title: str) -> dict:
-        """Search for custom connectors by title."""
-        payload = {"title": title}
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/custom_connectors/search",
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def get_custom_connector_code(self, connector_id: Union[int, str]) -> dict:
-        """Fetch code for a custom connector by ID."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/custom_connectors/{connector_id}/code",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def generate_schema_from_json(self, sample: str) -> dict:
-        """Generate Workato schema from a stringified JSON sample."""
-        payload = {"sample": sample}
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/sdk/generate_schema/json",
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def generate_schema_from_csv(self, sample: str, col_sep: Optional[str] = None) -> dict:
-        """Generate Workato schema from a stringified CSV sample."""
-        payload = {"sample": sample}
-        if col_sep:
-            payload["col_sep"] = col_sep
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/sdk/generate_schema/csv",
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def create_custom_connector(self, connector: dict) -> dict:
-        """Create a custom connector."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/custom_connectors",
-                headers=self.headers,
-                json=connector
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def release_custom_connector(self, connector_id: Union[int, str]) -> dict:
-        """Release the latest version of a custom connector."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/custom_connectors/{connector_id}/release",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def share_custom_connector(self, connector_id: Union[int, str]) -> dict:
-        """Share the most recently released version of a custom connector."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/custom_connectors/{connector_id}/share",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def update_custom_connector(self, connector_id: Union[int, str], connector: dict) -> dict:
-        """Update a custom connector."""
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"{self.base_url}/custom_connectors/{connector_id}",
-                headers=self.headers,
-                json=connector
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def list_connections(self, folder_id: Optional[str] = None, parent_id: Optional[str] = None, external_id: Optional[str] = None, include_runtime_connections: Optional[str] = None, includes: Optional[list] = None) -> dict:
-        """List all connections for the authenticated user."""
-        params = {}
-        if folder_id:
-            params["folder_id"] = folder_id
-        if parent_id:
-            params["parent_id"] = parent_id
-        if external_id:
-            params["external_id"] = external_id
-        if include_runtime_connections:
-            params["include_runtime_connections"] = include_runtime_connections
-        if includes:
-            params["includes[]"] = includes
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/connections",
-                headers=self.headers,
-                params=params
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def create_connection(self, connection: dict) -> dict:
-        """Create a new connection."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/connections",
-                headers=self.headers,
-                json=connection
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def update_connection(self, connection_id: Union[int, str], connection: dict) -> dict:
-        """Update a connection."""
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"{self.base_url}/connections/{connection_id}",
-                headers=self.headers,
-                json=connection
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def disconnect_connection(self, connection_id: Union[int, str], force: bool = False) -> dict:
-        """Disconnect a connection."""
-        payload = {"force": force} if force else {}
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/connections/{connection_id}/disconnect",
-                headers=self.headers,
-                json=payload if payload else None
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def delete_connection(self, connection_id: Union[int, str]) -> dict:
-        """Delete a connection."""
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{self.base_url}/connections/{connection_id}",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def list_lookup_tables(self, page: int = 1, per_page: int = 100) -> list:
-        """List all lookup tables for the authenticated user."""
-        params = {"page": page, "per_page": per_page}
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/lookup_tables",
-                headers=self.headers,
-                params=params
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def list_lookup_table_rows(self, lookup_table_id: Union[int, str], page: int = 1, per_page: int = 500, filters: Optional[dict] = None) -> list:
-        """List rows from a lookup table, with optional filters and pagination."""
-        params = {"page": page, "per_page": per_page}
-        if filters:
-            params.update(filters)
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/lookup_tables/{lookup_table_id}/rows",
-                headers=self.headers,
-                params=params
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def lookup_table_row(self, lookup_table_id: Union[int, str], filters: dict) -> dict:
-        """Find the first row matching the given criteria in the lookup table."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/lookup_tables/{lookup_table_id}/lookup",
-                headers=self.headers,
-                params=filters
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def get_lookup_table_row(self, lookup_table_id: Union[int, str], row_id: Union[int, str]) -> dict:
-        """Get a row from the lookup table by row ID."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.base_url}/lookup_tables/{lookup_table_id}/rows/{row_id}",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def add_lookup_table_row(self, lookup_table_id: Union[int, str], data: dict) -> dict:
-        """Add a row to the lookup table."""
-        payload = {"data": data}
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/lookup_tables/{lookup_table_id}/rows",
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def create_lookup_table(self, lookup_table: dict) -> dict:
-        """Create a new lookup table."""
-        payload = {"lookup_table": lookup_table}
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/lookup_tables",
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def batch_delete_lookup_tables(self, ids: list) -> dict:
-        """Delete lookup tables in batch."""
-        payload = {"ids": ids}
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.base_url}/lookup_tables/batch_delete",
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def update_lookup_table_row(self, lookup_table_id: Union[int, str], row_id: Union[int, str], data: dict) -> dict:
-        """Update a row in the lookup table."""
-        payload = {"data": data}
-        async with httpx.AsyncClient() as client:
-            response = await client.put(
-                f"{self.base_url}/lookup_tables/{lookup_table_id}/rows/{row_id}",
-                headers=self.headers,
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
-
-    async def delete_lookup_table_row(self, lookup_table_id: Union[int, str], row_id: Union[int, str]) -> dict:
-        """Delete a row from the lookup table."""
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{self.base_url}/lookup_tables/{lookup_table_id}/rows/{row_id}",
-                headers=self.headers
-            )
-            response.raise_for_status()
-            return response.json() 
\ No newline at end of file
+        Returns:
+            Delete results under ``succeeded`` and per-row errors under ``failed``.
+        """
+        return await self._gather_outcomes(
+            (self.delete_lookup_table_row(lookup_table_id, row_id) for row_id in row_ids),
+            concurrency
+        )
+
+class WorkatoSyncClient(_WorkatoClientBase):
+    """Synchronous twin of ``WorkatoClient`` for scripts and notebooks.
+
+    Exposes the same endpoint methods, generated from the same table, over a single
+    pooled HTTP/2 ``httpx.Client`` so no event loop is needed. Streaming and bulk
+    helpers are only available on ``WorkatoClient``. Use it as a context manager
+    (``with WorkatoSyncClient() as client:``) or call ``close()`` when done.
+    """
+
+    def __init__(
+        self,
+        api_token: Optional[str] = None,
+        base_url: Optional[str] = None,
+        cache_ttl: float = 30.0,
+        max_connections: int = 1000,
+        max_keepalive_connections: int = 100,
+    ):
+        super().__init__(api_token, base_url, cache_ttl, max_connections, max_keepalive_connections)
+        self._transport = RetryTransport(
+            httpx.HTTPTransport(http2=True, verify=_ssl_context(), limits=self._limits, retries=3)
+        )
+        self._client = httpx.Client(
+            base_url=self.base_url,
+            headers=self.headers,
+            timeout=self._timeout,
+            transport=self._transport
+        )
+
+    def close(self) -> None:
+        """Close the underlying HTTP client and release pooled connections."""
+        self._client.close()
+
+    def __enter__(self) -> "WorkatoSyncClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _request(self, method: str, path: str, json: Any = None, **kwargs) -> Any:
+        """Send a request through the shared HTTP client and return the decoded JSON body."""
+        response = self._client.request(method, path, **self._encode(json, kwargs))
+        self._invalidate_on_write(method, path)
+        return self._decode(response)
+
+for _endpoint in _ENDPOINTS:
+    setattr(WorkatoClient, _endpoint.name, _make_endpoint(_endpoint, "WorkatoClient", is_async=True))
+    setattr(WorkatoSyncClient, _endpoint.name, _make_endpoint(_endpoint, "WorkatoSyncClient", is_async=False))
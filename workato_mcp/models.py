@@ -1,12 +1,31 @@
-from pydantic import BaseModel, Field
+from dataclasses import dataclass
+from pydantic import BaseModel, ConfigDict, Field
 from typing import Optional, Union, Dict, Any
 
 class RecipeData(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     name: str = Field(..., description="Name of the recipe")
-    code: str = Field(..., description="Recipe code in JSON format")
+    code: Union[str, Dict[str, Any]] = Field(..., description="Recipe code, as a JSON string or a JSON object")
     folder_id: Optional[int] = Field(None, description="ID of the folder to place the recipe in")
     description: Optional[str] = Field(None, description="Description of the recipe")
 
 class TestRecipeInput(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
     recipe_id: Union[int, str] = Field(..., description="ID of the recipe to test")
-    input_data: Optional[Dict[str, Any]] = Field(None, description="Input data for testing the recipe") 
\ No newline at end of file
+    input_data: Optional[Dict[str, Any]] = Field(None, description="Input data for testing the recipe")
+
+@dataclass(slots=True, frozen=True)
+class LookupTableRow:
+    """A lookup table row as returned by the API, without a per-instance ``__dict__``.
+
+    Used where many rows are held at once; orjson serializes it like the source dict.
+    """
+
+    id: int
+    data: Dict[str, Any]
+
+    @classmethod
+    def from_dict(cls, row: Dict[str, Any]) -> "LookupTableRow":
+        return cls(id=row["id"], data=row.get("data") or {})
@@ -1,4 +1,5 @@
 import os
+import asyncio
 import logging
 from dotenv import load_dotenv
 from mcp.server.fastmcp import FastMCP
@@ -21,29 +22,49 @@ logging.basicConfig(
 )
 logger = logging.getLogger("workato_mcp")
 
-# Initialize the MCP server
-mcp = FastMCP(
-    "Workato MCP Server",
-    description="MCP Server for interacting with Workato APIs to manage recipes and jobs",
-    dependencies=["httpx", "python-dotenv", "pydantic"]
-)
-
 # Validate environment variables
 required_env_vars = ["WORKATO_API_TOKEN", "WORKATO_BASE_URL"]
 missing_vars = [var for var in required_env_vars if not os.getenv(var)]
 if missing_vars:
     raise ValueError(f"Missing required environment variables: {', '.join(missing_vars)}")
 
+# One client, and so one connection pool, shared by every tool and every session.
+# It lives as long as the process: FastMCP enters its lifespan once per session
+# (each SSE / streamable-HTTP connection), so it must not be closed from there.
+workato_client = WorkatoClient(
+    max_connections=int(os.getenv("WORKATO_HTTP_MAX_CONN", "1000")),
+    max_keepalive_connections=int(os.getenv("WORKATO_HTTP_KEEPALIVE", "100"))
+)
+
+
+# Initialize the MCP server. Each incoming request is dispatched in its own task,
+# so tool calls run concurrently; tools must stay reentrant, which they are as
+# long as they only share the Workato client, whose pool bounds the fan-out.
+mcp = FastMCP(
+    "Workato MCP Server",
+    instructions="MCP Server for interacting with Workato APIs to manage recipes and jobs",
+    dependencies=["httpx", "h2", "orjson", "ijson", "aiofiles", "python-dotenv", "pydantic"]
+)
+
 # Register tools
-register_recipe_tools(mcp)
-register_recipe_lifecycle_tools(mcp)
-register_custom_connector_sdk_tools(mcp)
-register_connection_tools(mcp)
-register_lookup_table_tools(mcp)
+register_recipe_tools(mcp, workato_client)
+register_recipe_lifecycle_tools(mcp, workato_client)
+register_custom_connector_sdk_tools(mcp, workato_client)
+register_connection_tools(mcp, workato_client)
+register_lookup_table_tools(mcp, workato_client)
 # (register other tool sets here)
 
+
+async def main() -> None:
+    """Serve over stdio, closing the shared Workato client once the server exits."""
+    try:
+        await mcp.run_stdio_async()
+    finally:
+        await workato_client.close()
+
+
 if __name__ == "__main__":
     logger.info("Starting Workato MCP server (FastMCP mode)")
     logger.info("MCP server is running and waiting for client connections via stdio")
-    mcp.run()
+    asyncio.run(main())
 
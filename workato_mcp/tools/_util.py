@@ -0,0 +1,63 @@
+import inspect
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+# (tool name, client method, result label, tool docstring[, items path])
+ToolSpec = Union[
+    Tuple[str, Callable[..., Awaitable[Any]], str, str],
+    Tuple[str, Callable[..., Awaitable[Any]], str, str, Tuple[str, ...]],
+]
+
+_ONLY = inspect.Parameter("only", inspect.Parameter.KEYWORD_ONLY, default=None, annotation=Optional[List[str]])
+
+
+def _fmt(label: str, result: Any) -> Dict[str, Any]:
+    """Wrap a tool result as ``{"label": ..., "data": ...}`` for FastMCP to serialize once."""
+    return {"label": label, "data": result}
+
+
+def _project(result: Any, only: Optional[List[str]], items_path: Tuple[str, ...] = ()) -> Any:
+    """Keep only the ``only`` fields of each item in a list response.
+
+    ``items_path`` is the key path to the item list: ``()`` for a bare list,
+    ``("items",)`` or ``("result", "assets")`` for enveloped ones. Everything off
+    that path is returned as is, and a response of another shape is left alone.
+    """
+    if not only:
+        return result
+    if items_path:
+        key, rest = items_path[0], items_path[1:]
+        if not isinstance(result, dict) or key not in result:
+            return result
+        return {**result, key: _project(result[key], only, rest)}
+    if isinstance(result, list):
+        return [{key: item[key] for key in only if key in item} if isinstance(item, dict) else item for item in result]
+    return result
+
+
+def _spec_tool(name: str, method: Callable[..., Awaitable[Any]], label: str, doc: str,
+               items_path: Optional[Tuple[str, ...]] = None) -> Callable[..., Awaitable[dict]]:
+    """Build a tool that forwards its arguments to ``method`` and formats the result.
+
+    The tool takes its parameters, and so its input schema, from the client method's
+    signature; only the name, label and LLM-facing docstring come from the spec.
+    Tools given an ``items_path`` also accept ``only``, a list of fields to keep on
+    each item found there.
+    """
+    signature = inspect.signature(method).replace(return_annotation=dict)
+    if items_path is not None:
+        signature = signature.replace(parameters=[*signature.parameters.values(), _ONLY])
+
+    async def tool(**kwargs) -> dict:
+        only = kwargs.pop("only", None)
+        return _fmt(label, _project(await method(**kwargs), only, items_path or ()))
+
+    tool.__name__ = tool.__qualname__ = name
+    tool.__doc__ = inspect.cleandoc(doc)
+    tool.__signature__ = signature
+    return tool
+
+
+def _register_specs(mcp, specs: Iterable[ToolSpec]) -> None:
+    """Register one pass-through tool per spec."""
+    for spec in specs:
+        mcp.tool()(_spec_tool(*spec))
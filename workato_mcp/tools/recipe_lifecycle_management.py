@@ -1,111 +1,85 @@
 from workato_mcp.client import WorkatoClient
-from typing import Union, Optional, Dict, Any
+from workato_mcp.tools._util import _fmt, _register_specs
+from typing import Union, Optional
 
-workato_client = WorkatoClient()
-
-def register_recipe_lifecycle_tools(mcp):
-    @mcp.tool()
-    async def get_folder_assets(folder_id: Optional[int] = None, include_test_cases: bool = False, include_data: bool = False) -> str:
-        """View assets in a folder for export manifests.
+def register_recipe_lifecycle_tools(mcp, client: WorkatoClient):
+    SPECS = [
+        ("get_folder_assets", client.get_folder_assets, "Folder assets", """View assets in a folder for export manifests.
 
         Args:
             folder_id: The ID of the folder containing the asset. Defaults to root folder.
             include_test_cases: Not supported, defaults to false.
             include_data: Whether to include data from the list of assets. Defaults to false.
+            only: Optional list of fields to keep per asset
+                (e.g., ['id', 'name', 'type', 'folder', 'absolute_path']).
         Returns:
-            JSON string containing folder assets.
-        """
-        result = await workato_client.get_folder_assets(folder_id, include_test_cases, include_data)
-        return f"Folder assets: {result}"
-
-    @mcp.tool()
-    async def create_export_manifest(export_manifest: Dict[str, Any]) -> str:
-        """Create an export manifest.
+            Dict with a "label" and folder assets under "data".
+        """, ("result", "assets")),
+        ("create_export_manifest", client.create_export_manifest, "Created export manifest", """Create an export manifest.
 
         Args:
             export_manifest: Dictionary representing the export manifest payload.
         Returns:
-            JSON string containing the created export manifest.
-        """
-        result = await workato_client.create_export_manifest(export_manifest)
-        return f"Created export manifest: {result}"
-
-    @mcp.tool()
-    async def update_export_manifest(manifest_id: Union[int, str], export_manifest: Dict[str, Any]) -> str:
-        """Update an export manifest.
+            Dict with a "label" and the created export manifest under "data".
+        """),
+        ("update_export_manifest", client.update_export_manifest, "Updated export manifest", """Update an export manifest.
 
         Args:
             manifest_id: The ID of the export manifest to update.
             export_manifest: Dictionary representing the updated export manifest payload.
         Returns:
-            JSON string containing the updated export manifest.
-        """
-        result = await workato_client.update_export_manifest(manifest_id, export_manifest)
-        return f"Updated export manifest: {result}"
-
-    @mcp.tool()
-    async def get_export_manifest(manifest_id: Union[int, str]) -> str:
-        """View an export manifest.
+            Dict with a "label" and the updated export manifest under "data".
+        """),
+        ("get_export_manifest", client.get_export_manifest, "Export manifest", """View an export manifest.
 
         Args:
             manifest_id: The ID of the export manifest to view.
         Returns:
-            JSON string containing the export manifest details.
-        """
-        result = await workato_client.get_export_manifest(manifest_id)
-        return f"Export manifest: {result}"
-
-    @mcp.tool()
-    async def delete_export_manifest(manifest_id: Union[int, str]) -> str:
-        """Delete an export manifest.
+            Dict with a "label" and the export manifest details under "data".
+        """),
+        ("delete_export_manifest", client.delete_export_manifest, "Delete export manifest result", """Delete an export manifest.
 
         Args:
             manifest_id: The ID of the export manifest to delete.
         Returns:
-            JSON string containing the delete result.
-        """
-        result = await workato_client.delete_export_manifest(manifest_id)
-        return f"Delete export manifest result: {result}"
-
-    @mcp.tool()
-    async def export_package(manifest_id: Union[int, str]) -> str:
-        """Export a package based on a manifest.
+            Dict with a "label" and the delete result under "data".
+        """),
+        ("export_package", client.export_package, "Export package result", """Export a package based on a manifest.
 
         Args:
             manifest_id: The ID of the export manifest to use for export.
         Returns:
-            JSON string containing the export package result.
-        """
-        result = await workato_client.export_package(manifest_id)
-        return f"Export package result: {result}"
+            Dict with a "label" and the export package result under "data".
+        """),
+        ("get_package", client.get_package, "Package details", """Get details of an imported or exported package.
+
+        Args:
+            package_id: The ID of the package.
+        Returns:
+            Dict with a "label" and the package details under "data".
+        """),
+    ]
+    _register_specs(mcp, SPECS)
 
     @mcp.tool()
-    async def import_package(folder_id: Union[int, str], file_bytes: bytes, restart_recipes: bool = False, include_tags: bool = False, folder_id_for_home_assets: Optional[str] = None) -> str:
+    async def import_package(folder_id: Union[int, str], file_bytes: Optional[bytes] = None, restart_recipes: bool = False, include_tags: bool = False, folder_id_for_home_assets: Optional[str] = None, file_path: Optional[str] = None) -> dict:
         """Import a package into a folder.
 
         Args:
             folder_id: The ID of the folder to import into.
-            file_bytes: The content of the zip file to import.
+            file_bytes: The content of the zip file to import. Intended for small packages only.
             restart_recipes: Whether to restart running recipes during import.
             include_tags: Whether to preserve tags assigned to assets.
             folder_id_for_home_assets: Optional folder for home assets.
+            file_path: Path to the zip file to import, streamed from disk in 64 KiB chunks.
+                Give either this or file_bytes.
         Returns:
-            JSON string containing the import package result.
-        """
-        result = await workato_client.import_package(folder_id, file_bytes, restart_recipes, include_tags, folder_id_for_home_assets)
-        return f"Import package result: {result}"
-
-    @mcp.tool()
-    async def get_package(package_id: Union[int, str]) -> str:
-        """Get details of an imported or exported package.
-
-        Args:
-            package_id: The ID of the package.
-        Returns:
-            JSON string containing the package details.
+            Dict with a "label" and the import package result under "data".
         """
-        result = await workato_client.get_package(package_id)
-        return f"Package details: {result}"
+        if (file_bytes is None) == (file_path is None):
+            raise ValueError("Provide exactly one of file_bytes or file_path.")
+        result = await client.import_package(folder_id, file_bytes, restart_recipes, include_tags, folder_id_for_home_assets, file=file_path)
+        return _fmt("Import package result", result)
 
     @mcp.tool()
     async def download_package(package_id: Union[int, str]) -> bytes:
@@ -116,5 +90,5 @@ def register_recipe_lifecycle_tools(mcp):
         Returns:
             The raw bytes of the downloaded package zip file.
         """
-        result = await workato_client.download_package(package_id)
-        return result 
\ No newline at end of file
+        result = await client.download_package(package_id)
+        return result
@@ -1,202 +1,150 @@
 from workato_mcp.client import WorkatoClient
+from workato_mcp.tools._util import _fmt, _project, _register_specs
 from workato_mcp.models import RecipeData, TestRecipeInput
-from typing import Union, Optional, Dict, Any
+from typing import List, Optional, Union
 
-workato_client = WorkatoClient()
-
-def register_recipe_tools(mcp):
-    @mcp.tool()
-    async def list_recipes(include_tags: bool = False) -> str:
-        """List all available recipes in Workato.
-
-        Args:
-            include_tags: Whether to include tags in the response.
-        Returns:
-            JSON string containing all recipes.
-        """
-        recipes = await workato_client.get_recipes(include_tags=include_tags)
-        return f"Found {len(recipes)} recipes:\n\n{recipes}"
-
-    @mcp.tool()
-    async def get_recipe(recipe_id: Union[int, str]) -> str:
-        """Get details for a specific recipe.
+def register_recipe_tools(mcp, client: WorkatoClient):
+    SPECS = [
+        ("get_recipe", client.get_recipe_details, "Recipe details", """Get details for a specific recipe.
 
         Args:
             recipe_id: The ID of the recipe to retrieve.
         Returns:
-            JSON string containing recipe details.
-        """
-        recipe = await workato_client.get_recipe_details(recipe_id)
-        return f"Recipe details:\n\n{recipe}"
-
-    @mcp.tool()
-    async def start_recipe(recipe_id: Union[int, str]) -> str:
-        """Start a recipe.
+            Dict with a "label" and recipe details under "data".
+        """),
+        ("start_recipe", client.start_recipe, "Start recipe result", """Start a recipe.
 
         Args:
             recipe_id: The ID of the recipe to start.
         Returns:
-            Status message.
-        """
-        result = await workato_client.start_recipe(recipe_id)
-        return f"Start recipe result: {result}"
-
-    @mcp.tool()
-    async def stop_recipe(recipe_id: Union[int, str]) -> str:
-        """Stop a recipe.
+            Dict with a "label" and the API response under "data".
+        """),
+        ("stop_recipe", client.stop_recipe, "Stop recipe result", """Stop a recipe.
 
         Args:
             recipe_id: The ID of the recipe to stop.
         Returns:
-            Status message.
-        """
-        result = await workato_client.stop_recipe(recipe_id)
-        return f"Stop recipe result: {result}"
-
-    @mcp.tool()
-    async def test_recipe(input: TestRecipeInput) -> str:
-        """Test a recipe with optional input data.
+            Dict with a "label" and the API response under "data".
+        """),
+        ("delete_recipe", client.delete_recipe, "Delete recipe result", """Delete a recipe.
 
         Args:
-            input: Test recipe input parameters.
+            recipe_id: The ID of the recipe to delete.
         Returns:
-            Test results.
-        """
-        result = await workato_client.test_recipe(
-            recipe_id=input.recipe_id,
-            input_data=input.input_data
-        )
-        return f"Test recipe result: {result}"
-
-    @mcp.tool()
-    async def create_recipe(recipe: RecipeData) -> str:
-        """Create a new recipe.
+            Dict with a "label" and the API response under "data".
+        """),
+        ("copy_recipe", client.copy_recipe, "Copy recipe result", """Copy a recipe to a new folder (optional).
 
         Args:
-            recipe: Recipe configuration data.
+            recipe_id: The ID of the recipe to copy.
+            folder_id: Optional folder ID for the copied recipe.
         Returns:
-            Created recipe details.
-        """
-        recipe_data = recipe.dict(exclude_none=True)
-        result = await workato_client.create_recipe(recipe_data)
-        return f"Created recipe: {result}"
-
-    @mcp.tool()
-    async def update_recipe(recipe_id: Union[int, str], recipe: RecipeData) -> str:
-        """Update an existing recipe.
+            Dict with a "label" and the copy result details under "data".
+        """),
+        ("reset_recipe_trigger", client.reset_recipe_trigger, "Reset recipe trigger result", """Reset the trigger for a recipe.
 
         Args:
-            recipe_id: The ID of the recipe to update.
-            recipe: Updated recipe configuration data.
+            recipe_id: The ID of the recipe to reset the trigger for.
         Returns:
-            Updated recipe details.
-        """
-        recipe_data = recipe.dict(exclude_none=True)
-        result = await workato_client.update_recipe(recipe_id, recipe_data)
-        return f"Updated recipe: {result}"
-
-    @mcp.tool()
-    async def delete_recipe(recipe_id: Union[int, str]) -> str:
-        """Delete a recipe.
+            Dict with a "label" and the reset result details under "data".
+        """),
+        ("update_recipe_connection", client.update_recipe_connection, "Update recipe connection result", """Update the connection for a stopped recipe.
 
         Args:
-            recipe_id: The ID of the recipe to delete.
+            recipe_id: The ID of the recipe to update the connection for.
+            adapter_name: The internal name of the connector.
+            connection_id: The ID of the new connection.
         Returns:
-            Status message.
-        """
-        result = await workato_client.delete_recipe(recipe_id)
-        return f"Delete recipe result: {result}"
-
-    @mcp.tool()
-    async def copy_recipe(recipe_id: Union[int, str], folder_id: Optional[str] = None) -> str:
-        """Copy a recipe to a new folder (optional).
+            Dict with a "label" and the update result details under "data".
+        """),
+        ("poll_recipe_now", client.poll_recipe_now, "Poll recipe now result", """Activate a polling trigger for a recipe.
 
         Args:
-            recipe_id: The ID of the recipe to copy.
-            folder_id: Optional folder ID for the copied recipe.
+            recipe_id: The ID of the recipe to poll now.
         Returns:
-            Copy result details.
-        """
-        result = await workato_client.copy_recipe(recipe_id, folder_id)
-        return f"Copy recipe result: {result}"
-
-    @mcp.tool()
-    async def reset_recipe_trigger(recipe_id: Union[int, str]) -> str:
-        """Reset the trigger for a recipe.
+            Dict with a "label" and the poll result details under "data".
+        """),
+        ("get_recipe_versions", client.get_recipe_versions, "Recipe versions", """Get all versions of a recipe.
 
         Args:
-            recipe_id: The ID of the recipe to reset the trigger for.
+            recipe_id: The ID of the recipe to get versions for.
+            page: Page number for pagination.
+            per_page: Number of versions per page.
         Returns:
-            Reset result details.
-        """
-        result = await workato_client.reset_recipe_trigger(recipe_id)
-        return f"Reset recipe trigger result: {result}"
+            Dict with a "label" and the recipe versions details under "data".
+        """),
+        ("get_recipe_version_details", client.get_recipe_version_details, "Recipe version details", """Get details of a specific recipe version.
 
-    @mcp.tool()
-    async def update_recipe_connection(recipe_id: Union[int, str], adapter_name: str, connection_id: int) -> str:
-        """Update the connection for a stopped recipe.
+        Args:
+            recipe_id: The ID of the recipe.
+            version_id: The ID of the version to retrieve.
+        Returns:
+            Dict with a "label" and the recipe version details under "data".
+        """),
+        ("update_recipe_version_comment", client.update_recipe_version_comment, "Update recipe version comment result", """Update the comment for a specific recipe version.
 
         Args:
-            recipe_id: The ID of the recipe to update the connection for.
-            adapter_name: The internal name of the connector.
-            connection_id: The ID of the new connection.
+            recipe_id: The ID of the recipe.
+            version_id: The ID of the version to update.
+            comment: The new comment for the version.
         Returns:
-            Update result details.
-        """
-        result = await workato_client.update_recipe_connection(recipe_id, adapter_name, connection_id)
-        return f"Update recipe connection result: {result}"
+            Dict with a "label" and the update result details under "data".
+        """),
+    ]
+    _register_specs(mcp, SPECS)
 
     @mcp.tool()
-    async def poll_recipe_now(recipe_id: Union[int, str]) -> str:
-        """Activate a polling trigger for a recipe.
+    async def list_recipes(include_tags: bool = False, only: Optional[List[str]] = None) -> dict:
+        """List all available recipes in Workato.
 
         Args:
-            recipe_id: The ID of the recipe to poll now.
+            include_tags: Whether to include tags in the response.
+            only: Optional list of fields to keep per recipe
+                (e.g., ['id', 'name', 'folder_id', 'running', 'last_run_at']).
         Returns:
-            Poll result details.
+            Dict with a "label" and all recipes under "data".
         """
-        result = await workato_client.poll_recipe_now(recipe_id)
-        return f"Poll recipe now result: {result}"
+        recipes = await client.get_recipes(include_tags=include_tags)
+        return _fmt(f"Found {len(recipes)} recipes", _project(recipes, only, ("items",)))
 
     @mcp.tool()
-    async def get_recipe_versions(recipe_id: Union[int, str], page: int = 1, per_page: int = 100) -> str:
-        """Get all versions of a recipe.
+    async def test_recipe(input: TestRecipeInput) -> dict:
+        """Test a recipe with optional input data.
 
         Args:
-            recipe_id: The ID of the recipe to get versions for.
-            page: Page number for pagination.
-            per_page: Number of versions per page.
+            input: Test recipe input parameters.
         Returns:
-            Recipe versions details.
+            Dict with a "label" and the test results under "data".
         """
-        result = await workato_client.get_recipe_versions(recipe_id, page, per_page)
-        return f"Recipe versions: {result}"
+        result = await client.test_recipe(
+            recipe_id=input.recipe_id,
+            input_data=input.input_data
+        )
+        return _fmt("Test recipe result", result)
 
     @mcp.tool()
-    async def get_recipe_version_details(recipe_id: Union[int, str], version_id: Union[int, str]) -> str:
-        """Get details of a specific recipe version.
+    async def create_recipe(recipe: RecipeData) -> dict:
+        """Create a new recipe.
 
         Args:
-            recipe_id: The ID of the recipe.
-            version_id: The ID of the version to retrieve.
+            recipe: Recipe configuration data.
         Returns:
-            Recipe version details.
+            Dict with a "label" and the created recipe details under "data".
         """
-        result = await workato_client.get_recipe_version_details(recipe_id, version_id)
-        return f"Recipe version details: {result}"
+        recipe_data = recipe.model_dump(mode="json", exclude_none=True)
+        result = await client.create_recipe(recipe_data)
+        return _fmt("Created recipe", result)
 
     @mcp.tool()
-    async def update_recipe_version_comment(recipe_id: Union[int, str], version_id: Union[int, str], comment: str) -> str:
-        """Update the comment for a specific recipe version.
+    async def update_recipe(recipe_id: Union[int, str], recipe: RecipeData) -> dict:
+        """Update an existing recipe.
 
         Args:
-            recipe_id: The ID of the recipe.
-            version_id: The ID of the version to update.
-            comment: The new comment for the version.
+            recipe_id: The ID of the recipe to update.
+            recipe: Updated recipe configuration data.
         Returns:
-            Update result details.
+            Dict with a "label" and the updated recipe details under "data".
         """
-        result = await workato_client.update_recipe_version_comment(recipe_id, version_id, comment)
-        return f"Update recipe version comment result: {result}"
-
-    # ...add more recipe tools here... 
\ No newline at end of file
+        recipe_data = recipe.model_dump(mode="json", exclude_none=True)
+        result = await client.update_recipe(recipe_id, recipe_data)
+        return _fmt("Updated recipe", result)